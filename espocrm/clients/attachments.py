@@ -5,16 +5,19 @@ AttachmentClient sınıfını içerir. File upload, download, validation ve bulk
 """
 
 import base64
-import hashlib
-import io
 import os
+import re
 import tempfile
 import threading
 from pathlib import Path
+from types import ModuleType
 from typing import Any, BinaryIO, Callable, Dict, List, Optional, Union
 from urllib.parse import urljoin
 
+import requests
+
 from ..exceptions import (
+    AttachmentError,
     EspoCRMError, 
     EspoCRMValidationError, 
     EspoCRMConnectionError,
@@ -42,8 +45,24 @@ from ..models.responses import (
     parse_list_response
 )
 from ..utils.helpers import timing_decorator
+from ..utils.http import HTTPClient
 from ..logging import get_logger
 
+_crc32c: Optional[ModuleType]
+try:
+    # x86_64 (SSE4.2) ve ARMv8 üzerinde donanım hızlandırmalı CRC32C
+    import crc32c as _crc32c
+except ImportError:
+    _crc32c = None
+
+
+# "bytes <start>-<end>/<total>" (RFC 9110 Content-Range)
+_CONTENT_RANGE_RE = re.compile(r"^bytes (\d+)-(\d+)/(\d+|\*)$")
+
+# download_to_bytes'ın metadata boyutuna göre önceden ayırdığı en büyük buffer;
+# sunucu daha büyük boyut bildirse de fazlası chunk geldikçe büyütülür
+_MAX_PREALLOCATE_SIZE = 8 * 1024 * 1024
+
 
 class ProgressCallback:
     """Progress tracking için callback sınıfı."""
@@ -133,6 +152,8 @@ class AttachmentClient:
         self.base_url = getattr(main_client, 'base_url', None)
         self.api_version = getattr(main_client, 'api_version', None)
         self.entities = getattr(main_client, 'entities', None)
+        # Download'larda her çağrıda main client üzerinden çözümlememek için
+        self.http_client: Optional[HTTPClient] = getattr(main_client, 'http_client', None)
         
         # Default validation config
         self.validation_config = FileValidationConfig()
@@ -448,6 +469,8 @@ class AttachmentClient:
         overwrite: bool = False,
         validate_checksum: bool = True,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        resume: bool = False,
+        if_none_match: Optional[str] = None,
         **kwargs
     ) -> Path:
         """Attachment dosyasını indirir.
@@ -458,6 +481,11 @@ class AttachmentClient:
             overwrite: Mevcut dosyanın üzerine yazılsın mı
             validate_checksum: Checksum doğrulaması yapılsın mı
             progress_callback: Progress callback fonksiyonu
+            resume: Yarım kalmış dosya varsa ``Range`` isteği ile kalan
+                kısmı indirip dosyaya ekle
+            if_none_match: Yerel kopyanın ETag'i; dosya mevcutsa
+                ``If-None-Match`` ile gönderilir ve 304 yanıtında dosya
+                yeniden indirilmez
             **kwargs: Ek request parametreleri
             
         Returns:
@@ -465,7 +493,9 @@ class AttachmentClient:
             
         Raises:
             EspoCRMNotFoundError: Attachment bulunamadı
-            FileExistsError: Dosya zaten mevcut ve overwrite=False
+            FileExistsError: Dosya zaten mevcut ve overwrite, resume ya da
+                if_none_match verilmedi
+            AttachmentError: Partial response beklenen aralığı kapsamıyor
             EspoCRMError: API hatası
             
         Example:
@@ -495,82 +525,165 @@ class AttachmentClient:
                 attachment_id=attachment_id
             )
             
-            # Download URL oluştur
-            download_endpoint = f"Attachment/file/{attachment_id}"
+            return self._download_attachment(
+                attachment_id,
+                attachment,
+                save_path=save_path,
+                overwrite=overwrite,
+                validate_checksum=validate_checksum,
+                progress_callback=progress_callback,
+                resume=resume,
+                if_none_match=if_none_match
+            )
             
-            # Progress tracking
-            progress = ProgressCallback(progress_callback)
-            if progress_callback:
-                progress.set_total(attachment.size)
+        except Exception as e:
+            self.logger.error(
+                "Failed to download file",
+                attachment_id=attachment_id,
+                error=str(e)
+            )
+            raise
+    
+    def _download_attachment(
+        self,
+        attachment_id: str,
+        attachment: Attachment,
+        save_path: Optional[Union[str, Path]] = None,
+        overwrite: bool = False,
+        validate_checksum: bool = True,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        resume: bool = False,
+        if_none_match: Optional[str] = None
+    ) -> Path:
+        """Bilgileri alınmış attachment'ın dosyasını indirir.
+        
+        ``download_file`` ve ``bulk_download`` tarafından ortak kullanılır;
+        bilgi isteği yapmaz.
+        
+        Args:
+            attachment_id: Attachment ID'si
+            attachment: Attachment bilgileri
+            save_path: Dosyanın kaydedileceği yol (opsiyonel)
+            overwrite: Mevcut dosyanın üzerine yazılsın mı
+            validate_checksum: Checksum doğrulaması yapılsın mı
+            progress_callback: Progress callback fonksiyonu
+            resume: Yarım kalmış dosyaya kalan kısmı ekle
+            if_none_match: Yerel kopyanın ETag'i
             
-            # Dosyayı indir
-            response = self.client.http_client.get(download_endpoint, stream=True)
+        Returns:
+            İndirilen dosyanın yolu
+        """
+        # Download URL oluştur
+        download_endpoint = f"Attachment/file/{attachment_id}"
+        
+        # Save path belirle - attachment name'i sanitize et
+        safe_filename = self._sanitize_filename(attachment.name)
+        
+        if save_path:
+            save_path = Path(save_path)
+            if save_path.is_dir():
+                final_path = save_path / safe_filename
+            else:
+                final_path = save_path
+        else:
+            final_path = Path(safe_filename)
+        
+        # Dosya mevcut mu kontrol et
+        existing_size = final_path.stat().st_size if final_path.exists() else None
+        if existing_size is not None and not (overwrite or resume or if_none_match):
+            raise FileExistsError(f"Dosya zaten mevcut: {final_path}")
+        
+        # Yarım dosya varsa sadece eksik byte'ları iste
+        resume_from = 0
+        if resume and existing_size and existing_size < attachment.size:
+            resume_from = existing_size
+        
+        # Progress tracking
+        progress = ProgressCallback(progress_callback)
+        if progress_callback:
+            progress.set_total(attachment.size)
+        
+        # Dosyayı indir
+        request_headers: Dict[str, str] = {}
+        if resume_from:
+            request_headers["Range"] = f"bytes={resume_from}-"
+        elif if_none_match and existing_size is not None:
+            request_headers["If-None-Match"] = if_none_match
+        
+        response = self._open_download_stream(download_endpoint, request_headers)
+        try:
+            # Yerel kopya güncel - body yok, dosyaya dokunma
+            if "If-None-Match" in request_headers and response.status_code == 304:
+                self.logger.info(
+                    "Attachment not modified",
+                    attachment_id=attachment_id,
+                    file_path=str(final_path)
+                )
+                return final_path
             
-            # Save path belirle - attachment name'i sanitize et
-            safe_filename = self._sanitize_filename(attachment.name)
+            if response.status_code not in (200, 206):
+                raise AttachmentError(
+                    f"Beklenmeyen download response'u: {response.status_code}",
+                    status_code=response.status_code
+                )
             
-            if save_path:
-                save_path = Path(save_path)
-                if save_path.is_dir():
-                    final_path = save_path / safe_filename
-                else:
-                    final_path = save_path
-            else:
-                final_path = Path(safe_filename)
+            # Body'yi okumadan önce Content-Range header'ını doğrula
+            self._validate_content_range(response, attachment.size, start=resume_from)
             
-            # Dosya mevcut mu kontrol et
-            if final_path.exists() and not overwrite:
-                raise FileExistsError(f"Dosya zaten mevcut: {final_path}")
+            # Sunucu Range'i desteklemiyorsa (200) tüm dosya baştan gelir
+            if response.status_code == 200:
+                resume_from = 0
             
-            # Dosyayı kaydet
+            # Dosya ancak geçerli bir 200/206 alındıktan sonra açılır
             final_path.parent.mkdir(parents=True, exist_ok=True)
             
-            downloaded_size = 0
-            checksum_hash = hashlib.md5() if validate_checksum else None
+            downloaded_size = resume_from
+            crc = _crc32c if validate_checksum else None
+            checksum = 0
             
-            with open(final_path, 'wb') as f:
+            if resume_from:
+                self.logger.info(
+                    "Resuming download",
+                    attachment_id=attachment_id,
+                    resume_from=resume_from
+                )
+                if crc is not None:
+                    with open(final_path, 'rb') as f:
+                        for chunk in iter(lambda: f.read(8192), b""):
+                            checksum = crc.crc32c(chunk, checksum)
+                if progress_callback:
+                    progress.update(resume_from)
+            
+            with open(final_path, 'ab' if resume_from else 'wb') as f:
                 for chunk in response.iter_content(chunk_size=8192):
                     if chunk:
                         f.write(chunk)
                         downloaded_size += len(chunk)
                         
-                        if checksum_hash:
-                            checksum_hash.update(chunk)
+                        if crc is not None:
+                            checksum = crc.crc32c(chunk, checksum)
                         
                         if progress_callback:
                             progress.update(len(chunk))
-            
-            # Checksum validation
-            if validate_checksum and checksum_hash:
-                calculated_checksum = checksum_hash.hexdigest()
-                # EspoCRM'den checksum bilgisi alınabilirse karşılaştır
-                # Şimdilik sadece boyut kontrolü yap
-                if downloaded_size != attachment.size:
-                    raise EspoCRMError(
-                        f"Dosya boyutu uyuşmuyor. Beklenen: {attachment.size}, "
-                        f"İndirilen: {downloaded_size}"
-                    )
-            
-            # Progress complete
-            if progress_callback:
-                progress.complete()
-            
-            self.logger.info(
-                "File downloaded successfully",
-                attachment_id=attachment_id,
-                file_path=str(final_path),
-                size=downloaded_size
-            )
-            
-            return final_path
-            
-        except Exception as e:
-            self.logger.error(
-                "Failed to download file",
-                attachment_id=attachment_id,
-                error=str(e)
-            )
-            raise
+        finally:
+            response.close()
+        
+        # Checksum validation
+        if validate_checksum:
+            self._validate_download(attachment, downloaded_size, checksum if crc is not None else None)
+        
+        # Progress complete
+        if progress_callback:
+            progress.complete()
+        
+        self.logger.info(
+            "File downloaded successfully",
+            attachment_id=attachment_id,
+            file_path=str(final_path),
+            size=downloaded_size
+        )
+        
+        return final_path
     
     @timing_decorator
     def download_to_bytes(
@@ -579,7 +692,7 @@ class AttachmentClient:
         validate_checksum: bool = True,
         progress_callback: Optional[Callable[[int, int], None]] = None,
         **kwargs
-    ) -> bytes:
+    ) -> bytearray:
         """Attachment dosyasını bytes olarak indirir.
         
         Args:
@@ -589,7 +702,7 @@ class AttachmentClient:
             **kwargs: Ek request parametreleri
             
         Returns:
-            Dosya verisi (bytes)
+            Dosya verisi (kopyalanmadan döndürülen ``bytearray``)
         """
         self.logger.info(
             "Downloading file to bytes",
@@ -609,46 +722,48 @@ class AttachmentClient:
             if progress_callback:
                 progress.set_total(attachment.size)
             
-            # Dosyayı indir
-            response = self.client.http_client.get(download_endpoint, stream=True)
-            
-            # Bytes buffer
-            file_data = io.BytesIO()
+            # Metadata'daki boyuta göre önceden ayrılmış (üst sınırlı) buffer;
+            # chunk'lar yeniden boyutlandırma olmadan yerinde kopyalanır
+            file_data = bytearray(min(attachment.size or 0, _MAX_PREALLOCATE_SIZE))
             downloaded_size = 0
-            checksum_hash = hashlib.md5() if validate_checksum else None
-            
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    file_data.write(chunk)
-                    downloaded_size += len(chunk)
-                    
-                    if checksum_hash:
-                        checksum_hash.update(chunk)
-                    
-                    if progress_callback:
-                        progress.update(len(chunk))
+            crc = _crc32c if validate_checksum else None
+            checksum = 0
+            
+            # Dosyayı indir
+            response = self._open_download_stream(download_endpoint)
+            try:
+                for chunk in response.iter_content(chunk_size=8192):
+                    if chunk:
+                        # Buffer taşarsa slice assignment bytearray'i büyütür
+                        file_data[downloaded_size:downloaded_size + len(chunk)] = chunk
+                        downloaded_size += len(chunk)
+                        
+                        if crc is not None:
+                            checksum = crc.crc32c(chunk, checksum)
+                        
+                        if progress_callback:
+                            progress.update(len(chunk))
+            finally:
+                response.close()
             
             # Checksum validation
-            if validate_checksum and checksum_hash:
-                if downloaded_size != attachment.size:
-                    raise EspoCRMError(
-                        f"Dosya boyutu uyuşmuyor. Beklenen: {attachment.size}, "
-                        f"İndirilen: {downloaded_size}"
-                    )
+            if validate_checksum:
+                self._validate_download(attachment, downloaded_size, checksum if crc is not None else None)
             
             # Progress complete
             if progress_callback:
                 progress.complete()
             
-            file_bytes = file_data.getvalue()
+            # Eksik gelen veri için kullanılmayan kısmı at; buffer kopyalanmadan döner
+            del file_data[downloaded_size:]
             
             self.logger.info(
                 "File downloaded to bytes successfully",
                 attachment_id=attachment_id,
-                size=len(file_bytes)
+                size=downloaded_size
             )
             
-            return file_bytes
+            return file_data
             
         except Exception as e:
             self.logger.error(
@@ -701,6 +816,68 @@ class AttachmentClient:
             )
             raise
     
+    @timing_decorator
+    def bulk_info(
+        self,
+        attachment_ids: List[str],
+        batch_size: int = 200,
+        **kwargs: Any
+    ) -> Dict[str, Attachment]:
+        """Birden fazla attachment'ın bilgilerini toplu olarak getirir.
+        
+        Her ``batch_size`` ID için tek bir ``GET Attachment`` isteği
+        (``where[id][in]``) atılır. ``bulk_download`` dönen eşlemeyi kullanarak
+        dosya başına ayrı bilgi isteği yapmaz.
+        
+        Args:
+            attachment_ids: Attachment ID'leri
+            batch_size: İstek başına maksimum ID sayısı
+            **kwargs: Ek request parametreleri
+            
+        Returns:
+            ID -> Attachment eşlemesi
+        """
+        self.logger.info(
+            "Getting bulk attachment info",
+            attachment_count=len(attachment_ids)
+        )
+        
+        attachments: Dict[str, Attachment] = {}
+        
+        try:
+            for start in range(0, len(attachment_ids), batch_size):
+                batch = attachment_ids[start:start + batch_size]
+                params: Dict[str, Any] = {
+                    "offset": 0,
+                    "maxSize": len(batch),
+                    "where": [{
+                        "type": "in",
+                        "attribute": "id",
+                        "value": batch
+                    }]
+                }
+                
+                response_data = self.client.get("Attachment", params=params, **kwargs)
+                list_response = parse_list_response(response_data, "Attachment")
+                
+                for attachment in list_response.get_entities(Attachment):
+                    attachments[attachment.id] = attachment
+            
+            self.logger.info(
+                "Bulk attachment info retrieved successfully",
+                requested=len(attachment_ids),
+                found=len(attachments)
+            )
+            
+            return attachments
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to get bulk attachment info",
+                error=str(e)
+            )
+            raise
+    
     @timing_decorator
     def list_attachments(
         self,
@@ -925,6 +1102,7 @@ class AttachmentClient:
         download_dir: Union[str, Path],
         overwrite: bool = False,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        validate_checksum: bool = True,
         **kwargs
     ) -> BulkOperationResult:
         """Bulk dosya indirme.
@@ -934,7 +1112,9 @@ class AttachmentClient:
             download_dir: İndirme dizini
             overwrite: Mevcut dosyaların üzerine yazılsın mı
             progress_callback: Progress callback fonksiyonu
-            **kwargs: Ek request parametreleri
+            validate_checksum: Her dosya için checksum doğrulaması yapılsın mı
+            **kwargs: Ek request parametreleri; ``resume`` ve ``if_none_match``
+                her dosyanın download'una iletilir
             
         Returns:
             Bulk operasyon sonucu
@@ -958,15 +1138,42 @@ class AttachmentClient:
         if progress_callback:
             progress.set_total(len(attachment_ids))
         
+        # Download seçenekleri bilgi isteğine gitmez; kalan kwargs request parametresidir
+        download_options: Dict[str, Any] = {
+            key: kwargs.pop(key) for key in ("resume", "if_none_match") if key in kwargs
+        }
+        download_options["validate_checksum"] = validate_checksum
+        
+        # Bilgileri tek seferde al; bulunamayanları download_file tek tek alır
+        try:
+            prefetched = self.bulk_info(attachment_ids, **kwargs)
+        except Exception as e:
+            self.logger.warning(
+                "Bulk attachment info failed, falling back to per-file requests",
+                error=str(e)
+            )
+            prefetched = {}
+        
         for i, attachment_id in enumerate(attachment_ids):
             try:
                 # Download
-                file_path = self.download_file(
-                    attachment_id=attachment_id,
-                    save_path=download_dir,
-                    overwrite=overwrite,
-                    **kwargs
-                )
+                attachment = prefetched.get(attachment_id)
+                if attachment is not None:
+                    file_path = self._download_attachment(
+                        attachment_id,
+                        attachment,
+                        save_path=download_dir,
+                        overwrite=overwrite,
+                        **download_options
+                    )
+                else:
+                    file_path = self.download_file(
+                        attachment_id=attachment_id,
+                        save_path=download_dir,
+                        overwrite=overwrite,
+                        **download_options,
+                        **kwargs
+                    )
                 
                 results.append({
                     "index": i,
@@ -1012,6 +1219,126 @@ class AttachmentClient:
         
         return bulk_result
     
+    def _validate_download(
+        self,
+        attachment: Attachment,
+        downloaded_size: int,
+        checksum: Optional[int]
+    ) -> None:
+        """İndirilen verinin boyutunu ve CRC32C checksum'ını doğrular.
+        
+        Checksum yalnızca attachment bilgisi ``crc32c`` alanı içeriyorsa ve
+        ``crc32c`` paketi kuruluysa karşılaştırılır.
+        
+        Args:
+            attachment: Attachment bilgisi
+            downloaded_size: İndirilen byte sayısı
+            checksum: Hesaplanan CRC32C (hesaplanmadıysa None)
+            
+        Raises:
+            EspoCRMError: Boyut uyuşmuyor
+            AttachmentError: Checksum uyuşmuyor
+        """
+        if downloaded_size != attachment.size:
+            raise EspoCRMError(
+                f"Dosya boyutu uyuşmuyor. Beklenen: {attachment.size}, "
+                f"İndirilen: {downloaded_size}"
+            )
+        
+        expected = getattr(attachment, "crc32c", None)
+        if checksum is None or expected is None:
+            return
+        
+        if checksum != int(expected):
+            raise AttachmentError(
+                f"Checksum uyuşmuyor. Beklenen CRC32C: {int(expected)}, "
+                f"Hesaplanan: {checksum}"
+            )
+    
+    def _open_download_stream(
+        self,
+        endpoint: str,
+        headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
+        """Download endpoint'ine stream edilen, parse edilmemiş GET isteği atar.
+        
+        ``HTTPClient.get`` body'yi parse ettiğinden download'lar status,
+        header ve ``iter_content`` için ham response'u kullanır.
+        
+        Args:
+            endpoint: Download endpoint'i
+            headers: Ek request header'ları (Range, If-None-Match)
+            
+        Returns:
+            Body'si henüz okunmamış HTTP response
+            
+        Raises:
+            EspoCRMError: Main client'ta HTTP client yok
+        """
+        if self.http_client is None:
+            raise EspoCRMError("Download için HTTP client gerekli")
+        
+        return self.http_client.request(
+            'GET',
+            endpoint,
+            headers=headers or None,
+            stream=True
+        )
+    
+    def _validate_content_range(
+        self,
+        response: requests.Response,
+        expected_size: int,
+        start: int = 0
+    ) -> None:
+        """Partial response'un beklenen byte aralığını kapsadığını doğrular.
+        
+        ``Content-Range`` header'ı içermeyen 200 response'larda kontrol
+        yapılmaz; 206 ise her zaman geçerli bir ``Content-Range`` taşımalıdır.
+        
+        Args:
+            response: Body'si henüz okunmamış ham HTTP response
+            expected_size: Attachment'ın toplam boyutu
+            start: İstenen ilk byte
+            
+        Raises:
+            AttachmentError: Status ile header uyuşmuyor veya aralık dosyayı
+                kapsamıyor
+        """
+        content_range = response.headers.get("Content-Range")
+        status_code = response.status_code
+        if content_range is None:
+            if status_code == 206:
+                raise AttachmentError(
+                    "206 response Content-Range içermiyor",
+                    status_code=status_code
+                )
+            return
+        
+        if status_code != 206:
+            raise AttachmentError(
+                f"Content-Range içeren response 206 olmalı, gelen: {status_code}",
+                status_code=status_code
+            )
+        
+        match = _CONTENT_RANGE_RE.match(content_range.strip())
+        if not match:
+            raise AttachmentError(f"Geçersiz Content-Range: {content_range}")
+        
+        range_start, range_end, total = match.groups()
+        if total != "*" and int(total) != expected_size:
+            raise AttachmentError(
+                f"Dosya boyutu uyuşmuyor. Beklenen: {expected_size}, "
+                f"Content-Range: {content_range}"
+            )
+        
+        if int(range_start) != start or int(range_end) + 1 < expected_size:
+            raise AttachmentError(
+                f"Content-Range dosyanın tamamını kapsamıyor. "
+                f"Beklenen: bytes {start}-{expected_size - 1}/{expected_size}, "
+                f"Gelen: {content_range}"
+            )
+    
     def _sanitize_filename(self, filename: str) -> str:
         """Dosya adını güvenli hale getirir.
         
@@ -7,10 +7,15 @@ schema validation ve intelligent caching özellikleri sağlar.
 
 import time
 import threading
-from typing import Any, Dict, List, Optional, Set, Type, Union
-from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union, cast
+from datetime import datetime
 
-from ..exceptions import EspoCRMError, EspoCRMValidationError, MetadataError
+from ..exceptions import (
+    EspoCRMConnectionError,
+    EspoCRMError,
+    EspoCRMValidationError,
+    MetadataError
+)
 from ..models.metadata import (
     ApplicationMetadata,
     EntityMetadata,
@@ -22,11 +27,18 @@ from ..models.metadata import (
 )
 from ..models.responses import parse_entity_response
 from ..utils.helpers import timing_decorator
+from ..utils.http import ConnectionError as HTTPConnectionError, TimeoutError as HTTPTimeoutError
 from ..logging import get_logger
 
 
 class MetadataCache:
-    """Metadata caching sistemi."""
+    """Metadata caching sistemi.
+    
+    Her key için ``(data, expires_at)`` tutulur; ``expires_at`` monotonic
+    saatten hesaplandığı için hit yolunda tek bir float karşılaştırması yapılır.
+    Süresi dolan entry'ler ``cleanup_expired`` çağrılana kadar ``get_stale``
+    ile okunabilir.
+    """
     
     def __init__(self, ttl_seconds: int = 3600):
         """Cache'i başlatır.
@@ -35,58 +47,54 @@ class MetadataCache:
             ttl_seconds: Time to live (saniye)
         """
         self.ttl_seconds = ttl_seconds
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._timestamps: Dict[str, datetime] = {}
+        self._cache: Dict[str, Tuple[Any, float]] = {}
         self._lock = threading.RLock()
     
     def get(self, key: str) -> Optional[Any]:
         """Cache'den veri alır."""
         with self._lock:
-            if key not in self._cache:
+            entry = self._cache.get(key)
+            if entry is None:
                 return None
             
+            data, expires_at = entry
             # TTL kontrolü
-            if self._is_expired(key):
-                self._remove(key)
+            if time.monotonic() > expires_at:
                 return None
             
-            return self._cache[key].get("data")
+            return data
+    
+    def get_stale(self, key: str) -> Optional[Any]:
+        """Süresi dolmuş olsa bile cache'deki veriyi döndürür."""
+        with self._lock:
+            entry = self._cache.get(key)
+            return entry[0] if entry is not None else None
     
     def set(self, key: str, data: Any) -> None:
         """Cache'e veri ekler."""
         with self._lock:
-            self._cache[key] = {"data": data}
-            self._timestamps[key] = datetime.now()
+            self._cache[key] = (data, time.monotonic() + self.ttl_seconds)
     
     def remove(self, key: str) -> None:
         """Cache'den veri siler."""
         with self._lock:
-            self._remove(key)
+            self._cache.pop(key, None)
     
     def clear(self) -> None:
         """Cache'i temizler."""
         with self._lock:
             self._cache.clear()
-            self._timestamps.clear()
-    
-    def _remove(self, key: str) -> None:
-        """Internal remove method."""
-        self._cache.pop(key, None)
-        self._timestamps.pop(key, None)
     
-    def _is_expired(self, key: str) -> bool:
-        """Key'in expire olup olmadığını kontrol eder."""
-        if key not in self._timestamps:
-            return True
-        
-        timestamp = self._timestamps[key]
-        return datetime.now() - timestamp > timedelta(seconds=self.ttl_seconds)
+    def _expired_keys(self) -> List[str]:
+        """Süresi dolmuş key'leri döndürür."""
+        now = time.monotonic()
+        return [key for key, (_, expires_at) in self._cache.items() if now > expires_at]
     
     def get_cache_info(self) -> Dict[str, Any]:
         """Cache bilgilerini döndürür."""
         with self._lock:
             total_keys = len(self._cache)
-            expired_keys = sum(1 for key in self._cache.keys() if self._is_expired(key))
+            expired_keys = len(self._expired_keys())
             
             return {
                 "total_keys": total_keys,
@@ -98,9 +106,24 @@ class MetadataCache:
     def cleanup_expired(self) -> None:
         """Expired cache entries'leri temizler."""
         with self._lock:
-            expired_keys = [key for key in self._cache.keys() if self._is_expired(key)]
-            for key in expired_keys:
-                self._remove(key)
+            for key in self._expired_keys():
+                del self._cache[key]
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """Bağlantı, timeout veya 5xx hatası mı kontrol eder (stale-if-error için)."""
+    # HTTPClient retry'lar tükenince kendi ConnectionError/TimeoutError'ını fırlatır
+    transient_types = (
+        HTTPConnectionError,
+        HTTPTimeoutError,
+        ConnectionError,
+        TimeoutError,
+        EspoCRMConnectionError
+    )
+    if isinstance(error, transient_types):
+        return True
+    
+    return isinstance(error, EspoCRMError) and (error.status_code or 0) >= 500
 
 
 class MetadataClient:
@@ -159,10 +182,11 @@ class MetadataClient:
             include_fields: Global fields dahil et
             
         Returns:
-            Application metadata
+            Application metadata; fetch başarısız olursa ve ``force_refresh``
+            verilmediyse cache'deki süresi dolmuş kopya
             
         Raises:
-            EspoCRMError: API hatası
+            EspoCRMError: API hatası (cache'de kopya yoksa)
             
         Example:
             >>> metadata = client.metadata.get_application_metadata()
@@ -217,6 +241,17 @@ class MetadataClient:
             return app_metadata
             
         except Exception as e:
+            # Stale-if-error: geçici hatalarda süresi dolmuş kopya döndürülür;
+            # auth/validation hataları her zaman yukarı iletilir
+            if not force_refresh and _is_transient_error(e):
+                stale_data = self.cache.get_stale(cache_key)
+                if stale_data is not None:
+                    self.logger.warning(
+                        "Failed to refresh application metadata, serving stale copy",
+                        error=str(e)
+                    )
+                    return cast(ApplicationMetadata, stale_data)
+            
             self.logger.error(
                 "Failed to fetch application metadata",
                 error=str(e)
@@ -300,6 +335,30 @@ class MetadataClient:
         app_metadata = self.get_application_metadata(force_refresh=force_refresh)
         return app_metadata.get_entity_metadata(entity_type)
     
+    def get_entities_metadata(
+        self,
+        entity_types: List[str],
+        force_refresh: bool = False
+    ) -> Dict[str, Optional[EntityMetadata]]:
+        """Birden fazla entity'nin metadata'sını tek application metadata isteğiyle alır.
+        
+        Args:
+            entity_types: Entity türleri
+            force_refresh: Cache'i bypass et
+            
+        Returns:
+            Entity türü -> entity metadata (yoksa None)
+            
+        Example:
+            >>> metas = client.metadata.get_entities_metadata(["Account", "Contact"])
+            >>> print(f"Contact fields: {list(metas['Contact'].fields.keys())}")
+        """
+        app_metadata = self.get_application_metadata(force_refresh=force_refresh)
+        return {
+            entity_type: app_metadata.get_entity_metadata(entity_type)
+            for entity_type in entity_types
+        }
+    
     def get_entity_field_metadata(
         self,
         entity_type: str,
@@ -641,12 +700,12 @@ class MetadataClient:
                 "has_global_fields": bool(app_metadata.fields),
                 "has_app_config": bool(app_metadata.app),
                 "supported_field_types": list(set(
-                    field_meta.type.value
+                    field_meta.type.value if hasattr(field_meta.type, 'value') else str(field_meta.type)
                     for entity_meta in app_metadata.entity_defs.values()
                     for field_meta in entity_meta.fields.values()
                 )),
                 "supported_relationship_types": list(set(
-                    rel_meta.type.value
+                    rel_meta.type.value if hasattr(rel_meta.type, 'value') else str(rel_meta.type)
                     for entity_meta in app_metadata.entity_defs.values()
                     for rel_meta in entity_meta.links.values()
                 )),
@@ -700,19 +759,18 @@ class MetadataClient:
                 self.logger.warning("No entity types found for cache warming")
                 return
             
-            # Her entity için metadata'yı cache'e yükle
-            for entity_type in entity_types:
-                try:
-                    self.get_entity_metadata(entity_type, force_refresh=True)
+            # Entity metadata'ları az önce yüklenen application metadata'dan
+            # okunur; entity başına yeniden fetch yapılmaz
+            entity_metas = self.get_entities_metadata(entity_types)
+            for entity_type, entity_meta in entity_metas.items():
+                if entity_meta is None:
+                    self.logger.warning(f"Failed to cache metadata for entity: {entity_type}")
+                else:
                     self.logger.debug(f"Cached metadata for entity: {entity_type}")
-                except Exception as e:
-                    self.logger.warning(
-                        f"Failed to cache metadata for entity: {entity_type}",
-                        error=str(e)
-                    )
             
-            # API capabilities'i yükle
-            self.detect_api_capabilities(force_refresh=True)
+            # API capabilities'i yeni metadata üzerinden yeniden hesapla
+            self.cache.remove("api_capabilities")
+            self.detect_api_capabilities()
             
             self.logger.info(
                 "Cache warming completed",
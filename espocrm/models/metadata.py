@@ -7,7 +7,7 @@ Application metadata, entity definitions, field definitions ve relationship defi
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union, Type, TypeVar
 from enum import Enum
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, field_validator
 
 from .base import EspoCRMBaseModel
 
@@ -58,6 +58,19 @@ class FieldType(str, Enum):
     FOREIGN_TYPE = "foreignType"
 
 
+# Field türü grupları; use_enum_values nedeniyle type düz str olarak da gelir,
+# str Enum üyeleri str ile aynı hash'e sahip olduğundan set lookup ikisinde de çalışır
+_RELATIONSHIP_FIELD_TYPES = frozenset({
+    FieldType.LINK,
+    FieldType.LINK_MULTIPLE,
+    FieldType.LINK_PARENT,
+    FieldType.FOREIGN,
+    FieldType.FOREIGN_ID,
+    FieldType.FOREIGN_TYPE
+})
+_ENUM_FIELD_TYPES = frozenset({FieldType.ENUM, FieldType.MULTI_ENUM})
+
+
 class RelationshipType(str, Enum):
     """EspoCRM ilişki türleri."""
     
@@ -192,18 +205,11 @@ class FieldMetadata(BaseMetadata):
     
     def is_relationship_field(self) -> bool:
         """İlişki field'ı mı kontrol eder."""
-        return self.type in [
-            FieldType.LINK,
-            FieldType.LINK_MULTIPLE,
-            FieldType.LINK_PARENT,
-            FieldType.FOREIGN,
-            FieldType.FOREIGN_ID,
-            FieldType.FOREIGN_TYPE
-        ]
+        return self.type in _RELATIONSHIP_FIELD_TYPES
     
     def is_enum_field(self) -> bool:
         """Enum field'ı mı kontrol eder."""
-        return self.type in [FieldType.ENUM, FieldType.MULTI_ENUM]
+        return self.type in _ENUM_FIELD_TYPES
     
     def get_validation_rules(self) -> Dict[str, Any]:
         """Field validation kurallarını döndürür."""
@@ -312,25 +318,6 @@ class EntityMetadata(BaseMetadata):
         description="Entity attribute'ları"
     )
     
-    @model_validator(mode='after')
-    def validate_fields_and_links(self):
-        """Field'ları ve link'leri doğrular."""
-        # Field'ları FieldMetadata instance'larına çevir
-        if isinstance(self.fields, dict):
-            for field_name, field_data in self.fields.items():
-                if not isinstance(field_data, FieldMetadata):
-                    if isinstance(field_data, dict):
-                        self.fields[field_name] = FieldMetadata(**field_data)
-        
-        # Link'leri RelationshipMetadata instance'larına çevir
-        if isinstance(self.links, dict):
-            for link_name, link_data in self.links.items():
-                if not isinstance(link_data, RelationshipMetadata):
-                    if isinstance(link_data, dict):
-                        self.links[link_name] = RelationshipMetadata(**link_data)
-        
-        return self
-    
     def get_field(self, field_name: str) -> Optional[FieldMetadata]:
         """Belirtilen field'ı döndürür."""
         return self.fields.get(field_name)
@@ -412,17 +399,6 @@ class ApplicationMetadata(BaseMetadata):
         description="Tema tanımları"
     )
     
-    @model_validator(mode='after')
-    def validate_entity_defs(self):
-        """Entity definitions'ları doğrular."""
-        if isinstance(self.entity_defs, dict):
-            for entity_name, entity_data in self.entity_defs.items():
-                if not isinstance(entity_data, EntityMetadata):
-                    if isinstance(entity_data, dict):
-                        self.entity_defs[entity_name] = EntityMetadata(**entity_data)
-        
-        return self
-    
     def get_entity_metadata(self, entity_type: str) -> Optional[EntityMetadata]:
         """Belirtilen entity'nin metadata'sını döndürür."""
         return self.entity_defs.get(entity_type)
@@ -458,17 +434,20 @@ class ApplicationMetadata(BaseMetadata):
             errors["entity"] = [f"Entity türü '{entity_type}' bulunamadı"]
             return errors
         
-        # Required field kontrolü
-        required_fields = entity_meta.get_required_fields()
-        for field_name in required_fields:
-            if field_name not in data or data[field_name] is None:
-                if "required" not in errors:
-                    errors["required"] = []
-                errors["required"].append(f"'{field_name}' field'ı zorunludur")
+        fields = entity_meta.fields
+        
+        # Required field kontrolü - field'lar üzerinde tek geçiş
+        missing = [
+            f"'{field_name}' field'ı zorunludur"
+            for field_name, field_meta in fields.items()
+            if field_meta.required and data.get(field_name) is None
+        ]
+        if missing:
+            errors["required"] = missing
         
         # Field validation
         for field_name, value in data.items():
-            field_meta = entity_meta.get_field(field_name)
+            field_meta = fields.get(field_name)
             if field_meta:
                 field_errors = self._validate_field_value(field_meta, value)
                 if field_errors:
@@ -498,7 +477,7 @@ class ApplicationMetadata(BaseMetadata):
                 errors.append(f"Maksimum değer {field_meta.max} olmalıdır")
         
         # Enum kontrolü
-        if field_meta.is_enum_field() and field_meta.options:
+        if field_meta.options and field_meta.type in _ENUM_FIELD_TYPES:
             if field_meta.type == FieldType.ENUM:
                 if value not in field_meta.options:
                     errors.append(f"Geçerli değerler: {', '.join(field_meta.options)}")
@@ -427,8 +427,9 @@ class HTTPClient:
             if 'url' in request_kwargs_copy:
                 del request_kwargs_copy['url']
             
-            # requests.Request için uygun olmayan parametreler
-            session_params = ['timeout', 'verify', 'allow_redirects', 'stream']
+            # _execute_request_with_retry'ın kendisi set ettiği parametreler;
+            # stream session.request'e iletilir (download'lar body'yi parça parça okur)
+            session_params = ['timeout', 'verify', 'allow_redirects']
             for param in session_params:
                 if param in request_kwargs_copy:
                     del request_kwargs_copy[param]
@@ -7,15 +7,18 @@ This module provides pytest fixtures, mock utilities, and test configuration.
 import json
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from unittest.mock import Mock
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Union
+from unittest.mock import MagicMock, Mock
 
 import pytest
 import requests
-import responses
 
 from espocrm.client import EspoCRMClient
+from espocrm.clients.attachments import AttachmentClient
 from espocrm.config import ClientConfig
+from espocrm.logging.logger import StructuredLogger
+from espocrm.utils.http import HTTPClient
 from espocrm.auth import (
     APIKeyAuth,
     HMACAuth,
@@ -298,46 +301,97 @@ def basic_auth():
     return create_basic_auth("testuser", password="testpass")
 
 
-@pytest.fixture
-def mock_client(test_config, api_key_auth):
-    """Mock EspoCRM client fixture."""
+def _build_mock_client(config: ClientConfig, auth: Any) -> Mock:
+    """Spec'd EspoCRM client mock shared by the mock client fixtures."""
     client = Mock(spec=EspoCRMClient)
-    client.config = test_config
-    client.auth = api_key_auth
-    client.base_url = test_config.base_url
+    client.config = config
+    client.auth = auth
+    client.base_url = config.base_url
     client.api_version = "v1"  # API version attribute'u ekle
-    client.logger = Mock()  # Logger attribute'u ekle
+    client.logger = Mock(spec=StructuredLogger)  # Logger attribute'u ekle
+    client.http_client = Mock(spec=HTTPClient)  # HTTP client for download paths
     return client
 
 
+@pytest.fixture
+def mock_client(test_config, api_key_auth):
+    """Mock EspoCRM client fixture."""
+    return _build_mock_client(test_config, api_key_auth)
+
+
+@pytest.fixture
+def fresh_mock_client(test_config, api_key_auth):
+    """Per-test mock client for tests that mutate client attributes."""
+    return _build_mock_client(test_config, api_key_auth)
+
+
+@pytest.fixture(scope="module")
+def module_mock_client():
+    """Module-scoped mock EspoCRM client fixture; reset it before stubbing."""
+    return _build_mock_client(ClientConfig(**TEST_CONFIG), create_api_key_auth("test_api_key_123"))
+
+
+@pytest.fixture
+def att_client(mock_client):
+    """Attachment client fixture bound to the mock client."""
+    return AttachmentClient(mock_client)
+
+
+@pytest.fixture
+def download_mock_client(mock_client):
+    """Mock client pre-configured for a single ``download_file`` call."""
+    file_content = b"Downloaded file content"
+    attachment_info = {
+        "id": "attachment_123",
+        "name": "document.pdf",
+        "type": "application/pdf",
+        "size": len(file_content)
+    }
+    download_response = FakeDownloadResponse([file_content])
+    
+    mock_client.get.return_value = attachment_info
+    # Downloads stream the body through HTTPClient.request
+    mock_client.http_client.request.return_value = download_response
+    return mock_client
+
+
 @pytest.fixture
 def real_client(test_config, api_key_auth):
     """Real EspoCRM client fixture for integration tests."""
     return EspoCRMClient(base_url=test_config.base_url, config=test_config, auth=api_key_auth)
 
 
+@pytest.fixture(scope="session")
+def _sample_records():
+    """Sample entity records parsed once per session; tests get deep copies."""
+    return MappingProxyType({
+        entity_type: EntityRecord.create_from_dict(MOCK_ENTITIES[entity_type].copy(), entity_type)
+        for entity_type in ("Account", "Contact", "Lead", "Opportunity")
+    })
+
+
 @pytest.fixture
-def sample_account():
+def sample_account(_sample_records):
     """Sample account entity fixture."""
-    return EntityRecord.create_from_dict(MOCK_ENTITIES["Account"].copy(), "Account")
+    return _sample_records["Account"].model_copy(deep=True)
 
 
 @pytest.fixture
-def sample_contact():
+def sample_contact(_sample_records):
     """Sample contact entity fixture."""
-    return EntityRecord.create_from_dict(MOCK_ENTITIES["Contact"].copy(), "Contact")
+    return _sample_records["Contact"].model_copy(deep=True)
 
 
 @pytest.fixture
-def sample_lead():
+def sample_lead(_sample_records):
     """Sample lead entity fixture."""
-    return EntityRecord.create_from_dict(MOCK_ENTITIES["Lead"].copy(), "Lead")
+    return _sample_records["Lead"].model_copy(deep=True)
 
 
 @pytest.fixture
-def sample_opportunity():
+def sample_opportunity(_sample_records):
     """Sample opportunity entity fixture."""
-    return EntityRecord.create_from_dict(MOCK_ENTITIES["Opportunity"].copy(), "Opportunity")
+    return _sample_records["Opportunity"].model_copy(deep=True)
 
 
 @pytest.fixture
@@ -400,6 +454,7 @@ def mock_metadata():
 @pytest.fixture
 def responses_mock():
     """Responses mock fixture for HTTP mocking."""
+    responses = pytest.importorskip("responses")
     with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
         yield rsps
 
@@ -426,7 +481,7 @@ def mock_http_responses(request, responses_mock, mock_server):
     
     # POST /api/v1/Account (create)
     responses_mock.add(
-        responses.POST,
+        responses_mock.POST,
         f"{base_url}/api/{api_version}/Account",
         json={
             "id": "account_1751483609360",
@@ -441,7 +496,7 @@ def mock_http_responses(request, responses_mock, mock_server):
     
     # GET /api/v1/Account/{id} (read)
     responses_mock.add(
-        responses.GET,
+        responses_mock.GET,
         f"{base_url}/api/{api_version}/Account/account_1751483609360",
         json={
             "id": "account_1751483609360",
@@ -456,7 +511,7 @@ def mock_http_responses(request, responses_mock, mock_server):
     
     # PATCH /api/v1/Account/{id} (partial update)
     responses_mock.add(
-        responses.PATCH,
+        responses_mock.PATCH,
         f"{base_url}/api/{api_version}/Account/account_1751483609360",
         json={
             "id": "account_1751483609360",
@@ -471,7 +526,7 @@ def mock_http_responses(request, responses_mock, mock_server):
     
     # DELETE /api/v1/Account/{id} (delete)
     responses_mock.add(
-        responses.DELETE,
+        responses_mock.DELETE,
         f"{base_url}/api/{api_version}/Account/account_1751483609360",
         json={"deleted": True},
         status=200
@@ -479,7 +534,7 @@ def mock_http_responses(request, responses_mock, mock_server):
     
     # GET /api/v1/Account (list)
     responses_mock.add(
-        responses.GET,
+        responses_mock.GET,
         f"{base_url}/api/{api_version}/Account",
         json={
             "total": 1,
@@ -496,7 +551,7 @@ def mock_http_responses(request, responses_mock, mock_server):
     # Conditionally add Metadata endpoint only if mock_metadata is True
     if mock_metadata:
         responses_mock.add(
-            responses.GET,
+            responses_mock.GET,
             f"{base_url}/api/{api_version}/Metadata",
             json=MOCK_METADATA,
             status=200
@@ -507,27 +562,78 @@ def mock_http_responses(request, responses_mock, mock_server):
 
 # Performance Test Utilities
 
+class PerformanceTimer:
+    """Simple monotonic timer; elapsed time is in seconds."""
+    
+    __slots__ = ("start_time", "end_time")
+    
+    def __init__(self) -> None:
+        self.start_time: Optional[float] = None
+        self.end_time: Optional[float] = None
+    
+    def start(self) -> None:
+        self.start_time = time.perf_counter()
+    
+    def stop(self) -> None:
+        self.end_time = time.perf_counter()
+    
+    @property
+    def elapsed(self) -> Optional[float]:
+        if self.start_time is not None and self.end_time is not None:
+            return self.end_time - self.start_time
+        return None
+
+
 @pytest.fixture
 def performance_timer():
     """Performance timer fixture."""
-    class Timer:
-        def __init__(self) -> None:
-            self.start_time: Optional[float] = None
-            self.end_time: Optional[float] = None
-        
-        def start(self) -> None:
-            self.start_time = time.time()
-        
-        def stop(self) -> None:
-            self.end_time = time.time()
-        
-        @property
-        def elapsed(self) -> Optional[float]:
-            if self.start_time and self.end_time:
-                return self.end_time - self.start_time
-            return None
-    
-    return Timer()
+    return PerformanceTimer()
+
+
+# Only the size of large payloads matters, so they are zero-filled buffers
+@pytest.fixture(scope="session")
+def payload_10mb():
+    """Shared 10MB payload fixture, allocated once per session."""
+    return bytes(10 * 1024 * 1024)
+
+
+@pytest.fixture(scope="session")
+def payload_100mb():
+    """Shared 100MB payload fixture, allocated once per session."""
+    return bytes(100 * 1024 * 1024)
+
+
+def fast_mock_open(data: bytes = b"") -> MagicMock:
+    """Lightweight ``open`` mock returning ``data`` from a single ``read()``."""
+    opener = MagicMock()
+    handle = opener.return_value.__enter__.return_value
+    handle.read.return_value = data
+    handle.readline.return_value = data[:0]
+    handle.__iter__.side_effect = lambda: iter((data,))
+    return opener
+
+
+@pytest.fixture(scope="class")
+def shared_file_open():
+    """``fast_mock_open`` fixture shared by every test in a class."""
+    return fast_mock_open(b"File content")
+
+
+@pytest.fixture
+def fake_fs(monkeypatch):
+    """Factory fixture patching ``open``/``Path.exists``/``Path.mkdir``."""
+    def _apply(data: bytes = b"", exists: bool = True, opener: Optional[MagicMock] = None) -> Mock:
+        if opener is None:
+            opener = fast_mock_open(data)
+        else:
+            # Shared opener: clear the previous test's calls
+            opener.reset_mock()
+        monkeypatch.setattr("builtins.open", opener)
+        monkeypatch.setattr("pathlib.Path.exists", lambda self: exists)
+        monkeypatch.setattr("pathlib.Path.mkdir", lambda self, *args, **kwargs: None)
+        return opener
+    
+    return _apply
 
 
 # Test Utilities
@@ -624,33 +730,53 @@ class MockResponseBuilder:
 
 # Security Test Utilities
 
-@pytest.fixture
+# Read-only payload table, inner values included, so tests cannot leak changes
+SECURITY_PAYLOADS = MappingProxyType({
+    "sql_injection": (
+        "'; DROP TABLE users; --",
+        "1' OR '1'='1",
+        "admin'--",
+        "' UNION SELECT * FROM users --"
+    ),
+    "xss_payloads": (
+        "<script>alert('xss')</script>",
+        "javascript:alert('xss')",
+        "<img src=x onerror=alert('xss')>",
+        "';alert('xss');//"
+    ),
+    "path_traversal": (
+        "../../../etc/passwd",
+        "..\\..\\..\\windows\\system32\\config\\sam",
+        "....//....//....//etc/passwd"
+    ),
+    "large_payloads": (
+        "A" * 1500000,  # Large string - 1.5MB, exceeds 1MB limit
+        MappingProxyType({f"key_{i}": f"value_{i}" * 1000 for i in range(1000)}),  # Large object - each value is 1000 chars
+        tuple(range(100000))  # Large array - 100,000 elements
+    )
+})
+
+
+# Test parameter -> payload category (see pytest_generate_tests)
+_SECURITY_PAYLOAD_PARAMS = {
+    "sql_payload": "sql_injection",
+    "xss_payload": "xss_payloads",
+    "path_traversal_payload": "path_traversal",
+    "large_payload": "large_payloads",
+}
+
+
+def _security_payload_id(payload: Any) -> str:
+    """Test id for a security payload."""
+    if isinstance(payload, str) and len(payload) <= 40:
+        return payload
+    return f"{type(payload).__name__}{len(payload)}"
+
+
+@pytest.fixture(scope="session")
 def security_test_data():
-    """Security test data fixture."""
-    return {
-        "sql_injection": [
-            "'; DROP TABLE users; --",
-            "1' OR '1'='1",
-            "admin'--",
-            "' UNION SELECT * FROM users --"
-        ],
-        "xss_payloads": [
-            "<script>alert('xss')</script>",
-            "javascript:alert('xss')",
-            "<img src=x onerror=alert('xss')>",
-            "';alert('xss');//"
-        ],
-        "path_traversal": [
-            "../../../etc/passwd",
-            "..\\..\\..\\windows\\system32\\config\\sam",
-            "....//....//....//etc/passwd"
-        ],
-        "large_payloads": [
-            "A" * 1500000,  # Large string - 1.5MB, exceeds 1MB limit
-            {f"key_{i}": f"value_{i}" * 1000 for i in range(1000)},  # Large object - each value is 1000 chars
-            list(range(100000))  # Large array - 100,000 elements
-        ]
-    }
+    """Security test data fixture, shared for the whole session."""
+    return SECURITY_PAYLOADS
 
 
 # Error Simulation Utilities
@@ -706,6 +832,102 @@ def error_simulator():
     return ErrorSimulator()
 
 
+class FakeDownloadResponse:
+    """Slotted stand-in for a streamed ``requests.Response`` in download tests."""
+    
+    __slots__ = ("chunks", "status_code", "headers", "iter_content_calls")
+    
+    def __init__(
+        self,
+        chunks: Optional[Union[List[bytes], bytes, bytearray, memoryview]] = None,
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None
+    ):
+        self.chunks = chunks if chunks is not None else []
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.iter_content_calls = 0
+    
+    def iter_content(self, chunk_size: int = 8192):
+        """Yield the configured chunks, counting calls."""
+        self.iter_content_calls += 1
+        if isinstance(self.chunks, (bytes, bytearray, memoryview)):
+            view = memoryview(self.chunks)
+            return (view[i:i + chunk_size] for i in range(0, len(view), chunk_size))
+        return iter(self.chunks)
+    
+    def close(self) -> None:
+        """No-op; the real response releases its connection here."""
+
+
+@pytest.fixture
+def fake_download_response():
+    """Factory fixture for :class:`FakeDownloadResponse`."""
+    return FakeDownloadResponse
+
+
+class FakeTransportResponse:
+    """Slotted stand-in for ``requests.Response`` with a pre-parsed JSON body."""
+    
+    __slots__ = ("status_code", "payload", "headers")
+    
+    def __init__(self, status_code: int, payload: Any, headers: Optional[Dict[str, str]] = None):
+        self.status_code = status_code
+        self.payload = payload
+        self.headers = headers or {}
+    
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+    
+    @property
+    def reason(self) -> str:
+        return "OK" if self.ok else "Error"
+    
+    @property
+    def text(self) -> str:
+        return json.dumps(self.payload)
+    
+    def json(self) -> Any:
+        return self.payload
+
+
+_FAKE_ACCOUNT_ID = "account_1751483609360"
+_FAKE_ACCOUNT = {
+    "id": _FAKE_ACCOUNT_ID,
+    "name": "Integration Test Company",
+    "type": "Customer",
+    "industry": "Technology",
+    "createdAt": "2024-01-01T10:00:00+00:00",
+    "modifiedAt": "2024-01-01T10:00:00+00:00"
+}
+_FAKE_ROUTES = MappingProxyType({
+    ("POST", "Account"): (201, _FAKE_ACCOUNT),
+    ("GET", f"Account/{_FAKE_ACCOUNT_ID}"): (200, _FAKE_ACCOUNT),
+    ("PATCH", f"Account/{_FAKE_ACCOUNT_ID}"): (
+        200,
+        {**_FAKE_ACCOUNT, "industry": "Healthcare", "modifiedAt": "2024-01-01T11:00:00+00:00"}
+    ),
+    ("DELETE", f"Account/{_FAKE_ACCOUNT_ID}"): (200, {"deleted": True}),
+    ("GET", "Account"): (200, {"total": 1, "list": [{**_FAKE_ACCOUNT, "industry": "Healthcare"}]}),
+})
+
+
+@pytest.fixture
+def fake_transport(real_client, monkeypatch):
+    """In-memory transport fixture for ``real_client``; returns its route table."""
+    routes = dict(_FAKE_ROUTES)
+    prefix = f"{real_client.http_client.base_url}/"
+    
+    def request(method: str, url: str, **kwargs: Any) -> FakeTransportResponse:
+        path = url[len(prefix):].partition("?")[0]
+        status, payload = routes.get((method.upper(), path), (404, {"message": "Not found"}))
+        return FakeTransportResponse(status, payload)
+    
+    monkeypatch.setattr(real_client.http_client.session, "request", request)
+    return routes
+
+
 # Parametrized Test Data
 
 @pytest.fixture(params=["Account", "Contact", "Lead", "Opportunity"])
@@ -738,6 +960,14 @@ def cleanup_after_test():
     yield
 
 
+def pytest_generate_tests(metafunc):
+    """Parametrize security payload arguments, one test per payload."""
+    for argname, category in _SECURITY_PAYLOAD_PARAMS.items():
+        if argname in metafunc.fixturenames:
+            payloads = SECURITY_PAYLOADS[category]
+            metafunc.parametrize(argname, payloads, ids=[_security_payload_id(p) for p in payloads])
+
+
 # Test Markers
 
 def pytest_configure(config):
@@ -4,19 +4,19 @@ EspoCRM Attachments Client Test Module
 Attachment operasyonları için kapsamlı testler.
 """
 
-import pytest
-import json
-import io
+import itertools
 import os
-import tempfile
-from unittest.mock import Mock, patch, MagicMock, mock_open
-from datetime import datetime
-import responses
+import re
+from pathlib import Path
+from types import MappingProxyType
+
+import pytest
+from unittest.mock import ANY, patch
 
 from espocrm.clients.attachments import AttachmentClient
-from espocrm.models.attachments import Attachment, AttachmentInfo
-from espocrm.models.entities import Entity
-from espocrm.models.responses import ListResponse, AttachmentResponse
+from espocrm.utils.http import EspoCRMHTTPAdapter
+from espocrm.models.attachments import Attachment, FileValidationConfig, SecurityValidationError
+from espocrm.models.responses import ListResponse
 from espocrm.exceptions import (
     EspoCRMError,
     EntityNotFoundError,
@@ -25,14 +25,175 @@ from espocrm.exceptions import (
 )
 
 
+# Attachment response'ları için ortak şablon
+_ATT_BASE = MappingProxyType({
+    "id": "attachment_123",
+    "name": "document.pdf",
+    "type": "application/pdf",
+    "size": 1024
+})
+
+
+def _att_resp(**overrides):
+    """Şablon üzerine override'ları uygulanmış attachment response'u döndürür."""
+    return {**_ATT_BASE, **overrides}
+
+
+# Corrupted/partial download senaryoları için sabit attachment bilgisi
+_CORRUPT_META = MappingProxyType({
+    "id": "attachment_123",
+    "name": "document.pdf",
+    "type": "application/pdf",
+    "size": 1000  # Expected size
+})
+_CORRUPT_CHUNK = b"corrupted data"  # Only 14 bytes
+
+# Çok chunk'lı download senaryoları için tek paylaşılan buffer (~20KB)
+_BUF = bytes(range(256)) * 80
+
+# Parametrized testler için önceden hazırlanmış dosya adları ve where çiftleri
+_FILE_TYPES = {
+    "pdf": "application/pdf",
+    "jpg": "image/jpeg",
+    "png": "image/png",
+    "txt": "text/plain",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+}
+_FILENAMES = {ft: f"test.{ft}" for ft in _FILE_TYPES}
+_ENTITY_WHERE = {
+    et: [("parentType", et), ("parentId", "entity_123")]
+    for et in ("Account", "Contact", "Lead", "Opportunity")
+}
+
+# Süre eşikleri yalnızca RUN_PERF_TESTS set edildiğinde kontrol edilir;
+# aksi halde bulk testler aynı mock akışını daha az iterasyonla çalıştırır
+_PERF_ENABLED = bool(os.environ.get("RUN_PERF_TESTS"))
+_PERF_ITERATIONS = 20 if _PERF_ENABLED else 2
+
+# Bulk upload senaryosu için sabit içerik ve dosya isimleri
+_BULK_CONTENT = b"File content"
+_BULK_FILE_NAMES = tuple(f"file_{i}.txt" for i in range(_PERF_ITERATIONS))
+
+
+def _single_call(method):
+    """Tek kez çağrılmış mock method'un (args, kwargs) ikilisini döndürür."""
+    assert method.call_count == 1
+    return method.call_args
+
+
+@pytest.fixture(scope="module")
+def _module_att_client(module_mock_client):
+    """Module genelinde tek AttachmentClient instance'ı."""
+    return AttachmentClient(module_mock_client)
+
+
+@pytest.fixture
+def mock_client(module_mock_client):
+    """Her test için sıfırlanmış, module'de paylaşılan mock client."""
+    module_mock_client.reset_mock(return_value=True, side_effect=True)
+    return module_mock_client
+
+
+@pytest.fixture
+def att_client(mock_client, _module_att_client):
+    """Paylaşılan mock client'a bağlı, validation config'i sıfırlanmış AttachmentClient."""
+    _module_att_client.validation_config = FileValidationConfig()
+    return _module_att_client
+
+
+# Entity bazlı list testleri için tek elemanlı sabit response
+_SINGLE_ATTACHMENT_LIST = MappingProxyType({
+    "total": 1,
+    "list": ({"id": "att_1", "name": "file.pdf"},)
+})
+
+
+@pytest.fixture
+def preconfigured_client(mock_client, att_client):
+    """List response'u hazır, paylaşılan AttachmentClient."""
+    mock_client.get.return_value = _SINGLE_ATTACHMENT_LIST
+    return att_client
+
+
+# Integration workflow için attachment endpoint'leri
+_API_URL = "https://test.espocrm.com/api/v1/"
+_WORKFLOW_ID = "att_integration_1"
+_WORKFLOW_DATA = b"Test file content for integration"
+_WORKFLOW_ATTACHMENT = {
+    "id": _WORKFLOW_ID,
+    "name": "integration_test.txt",
+    "type": "text/plain",
+    "size": len(_WORKFLOW_DATA)
+}
+_WORKFLOW_CHECKS = {
+    "upload": lambda result: result.data.get("id") == _WORKFLOW_ID,
+    "info": lambda result: result.data.get("name") == "integration_test.txt",
+    "download": lambda path: path.read_bytes() == _WORKFLOW_DATA,
+    "delete": lambda result: result is True,
+}
+
+
+@pytest.fixture(scope="module")
+def rsps():
+    """Endpoint'leri bir kez kaydedilmiş, module genelinde tek RequestsMock."""
+    # responses yalnızca integration testleri seçildiğinde import edilir
+    responses = pytest.importorskip("responses")
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        mock.add(
+            responses.POST,
+            re.compile(re.escape(_API_URL) + r"Attachment$"),
+            json=_WORKFLOW_ATTACHMENT
+        )
+        mock.add(
+            responses.GET,
+            re.compile(re.escape(_API_URL) + r"Attachment/file/[\w-]+$"),
+            body=_WORKFLOW_DATA,
+            content_type="text/plain"
+        )
+        mock.add(
+            responses.GET,
+            re.compile(re.escape(_API_URL) + r"Attachment/[\w-]+$"),
+            json=_WORKFLOW_ATTACHMENT
+        )
+        mock.add(
+            responses.DELETE,
+            re.compile(re.escape(_API_URL) + r"Attachment/[\w-]+$"),
+            json=True
+        )
+        yield mock
+
+
+@pytest.fixture
+def download_rsps():
+    """Her test için boş RequestsMock; download'lar gerçek HTTPClient'tan geçer."""
+    responses = pytest.importorskip("responses")
+    with responses.RequestsMock() as mock:
+        yield mock
+
+
+# download_rsps ile kullanılan attachment bilgi ve dosya endpoint'leri
+_INFO_URL = _API_URL + "Attachment/attachment_123"
+_FILE_URL = _API_URL + "Attachment/file/attachment_123"
+
+
+@pytest.fixture
+def pooled_client(real_client):
+    """Adımlar arasında tek connection pool kullanan real client."""
+    adapter = EspoCRMHTTPAdapter(pool_connections=1, pool_maxsize=1)
+    real_client.http_client.session.mount("https://", adapter)
+    return real_client
+
+
 @pytest.mark.unit
 @pytest.mark.attachments
 class TestAttachmentClient:
     """Attachments Client temel testleri."""
     
-    def test_attachments_client_initialization(self, mock_client):
+    def test_attachments_client_initialization(self, fresh_mock_client):
         """Attachments client initialization testi."""
-        # Mock client'a gerekli özellikleri ekle
+        # Özellikler test'e özel mock'a eklenir; paylaşılan mock değişmez
+        mock_client = fresh_mock_client
         mock_client.base_url = "https://test.espocrm.com"
         mock_client.api_version = "v1"
         mock_client.entities = {}
@@ -42,53 +203,47 @@ class TestAttachmentClient:
         assert att_client.client == mock_client
         assert att_client.base_url == mock_client.base_url
         assert att_client.api_version == mock_client.api_version
+        assert att_client.http_client is mock_client.http_client
     
-    def test_upload_file_success(self, mock_client):
+    def test_upload_file_success(self, mock_client, att_client, fake_fs):
         """File upload başarı testi."""
         # Mock response setup
-        mock_response = {
-            "id": "attachment_123",
-            "name": "test_document.pdf",
-            "type": "application/pdf",
-            "size": 1024,
-            "createdAt": "2024-01-01T10:00:00+00:00",
-            "createdById": "user_123"
-        }
+        mock_response = _att_resp(
+            name="test_document.pdf",
+            createdAt="2024-01-01T10:00:00+00:00",
+            createdById="user_123"
+        )
         mock_client.post.return_value = mock_response
         
-        att_client = AttachmentClient(mock_client)
-        
         # Mock file data
         file_data = b"PDF file content"
         file_path = "/tmp/test_document.pdf"
         
-        with patch("builtins.open", mock_open(read_data=file_data)):
-            with patch("pathlib.Path.exists", return_value=True):
-                result = att_client.upload_file(
-                    file_path=file_path,
-                    related_type="Document",
-                    field="file"
-                )
+        fake_fs(file_data)
+        result = att_client.upload_file(
+            file_path=file_path,
+            related_type="Document",
+            field="file"
+        )
         
         # Assertions - result is EntityResponse, not Attachment directly
         assert result is not None
         
         # API call verification
-        mock_client.post.assert_called_once()
+        args, kwargs = _single_call(mock_client.post)
+        assert args == ("Attachment",) and "data" in kwargs
     
-    def test_upload_file_from_bytes(self, mock_client):
+    def test_upload_file_from_bytes(self, mock_client, att_client):
         """Bytes'tan file upload testi."""
         # Mock response setup
-        mock_response = {
-            "id": "attachment_456",
-            "name": "data.txt",
-            "type": "text/plain",
-            "size": 11
-        }
+        mock_response = _att_resp(
+            id="attachment_456",
+            name="data.txt",
+            type="text/plain",
+            size=11
+        )
         mock_client.post.return_value = mock_response
         
-        att_client = AttachmentClient(mock_client)
-        
         # File data as bytes
         file_data = b"Hello World"
         file_name = "data.txt"
@@ -103,123 +258,166 @@ class TestAttachmentClient:
         # Assertions
         assert result is not None
     
-    def test_upload_file_with_metadata(self, mock_client):
+    def test_upload_file_with_metadata(self, mock_client, att_client, fake_fs):
         """Metadata ile file upload testi."""
         # Mock response setup
-        mock_response = {
-            "id": "attachment_789",
-            "name": "report.xlsx",
-            "type": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            "size": 2048
-        }
+        mock_response = _att_resp(
+            id="attachment_789",
+            name="report.xlsx",
+            type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            size=2048
+        )
         mock_client.post.return_value = mock_response
         
-        att_client = AttachmentClient(mock_client)
-        
         file_data = b"Excel file content"
         file_path = "/tmp/report.xlsx"
         
-        with patch("builtins.open", mock_open(read_data=file_data)):
-            with patch("pathlib.Path.exists", return_value=True):
-                result = att_client.upload_file(
-                    file_path=file_path,
-                    related_type="Document",
-                    field="file"
-                )
+        fake_fs(file_data)
+        result = att_client.upload_file(
+            file_path=file_path,
+            related_type="Document",
+            field="file"
+        )
         
         # Assertions
         assert result is not None
     
-    def test_download_file_success(self, mock_client):
+    def test_download_file_success(self, download_mock_client, att_client, fake_fs):
         """File download başarı testi."""
-        # Mock file download response
-        file_content = b"Downloaded file content"
-        
-        # Mock attachment info response - size should match file_content length
-        attachment_info_response = {
-            "id": "attachment_123",
-            "name": "document.pdf",
-            "type": "application/pdf",
-            "size": len(file_content)  # 23 bytes to match actual content
-        }
+        fake_fs(exists=False)
+        result = att_client.download_file("attachment_123")
         
-        mock_download_response = Mock()
-        mock_download_response.iter_content.return_value = [file_content]
-        
-        # Setup mock client responses
-        mock_client.get.side_effect = [attachment_info_response, mock_download_response]
-        mock_client.http_client = Mock()
-        mock_client.http_client.get.return_value = mock_download_response
+        # Assertions
+        assert result is not None
         
-        att_client = AttachmentClient(mock_client)
+        # API call verification: tek bilgi isteği, tek stream edilen download
+        download_mock_client.get.assert_called_once()
+        download_mock_client.http_client.request.assert_called_once_with(
+            "GET", "Attachment/file/attachment_123", headers=None, stream=True
+        )
+    
+    def test_download_file_to_path(self, download_mock_client, att_client, fake_fs):
+        """File download to path testi."""
+        # open patch'li olduğundan path hiç oluşturulmuyor
+        temp_path = Path("/tmp/espocrm_test_download_dummy")
         
-        with patch("pathlib.Path.exists", return_value=False):
-            with patch("pathlib.Path.mkdir"):
-                with patch("builtins.open", mock_open()) as mock_file:
-                    result = att_client.download_file("attachment_123")
+        fake_fs(exists=False)
+        result = att_client.download_file("attachment_123", save_path=temp_path)
         
         # Assertions
-        assert result is not None
+        assert result == temp_path
+    
+    @pytest.mark.parametrize("chunks,size", [
+        ([b"abc", b"", b"def"], 6),  # Tam boyut
+        ([b"abc"], 6),  # Eksik veri
+        ([b"abc", b"defgh"], 6),  # Beklenenden fazla veri
+    ])
+    def test_download_to_bytes(self, mock_client, att_client, fake_download_response, chunks, size):
+        """Bytes'a download testi."""
+        mock_client.get.return_value = _att_resp(name="data.bin", type="application/octet-stream", size=size)
+        mock_client.http_client.request.return_value = fake_download_response(chunks)
         
-        # API call verification
-        assert mock_client.get.call_count >= 1
+        result = att_client.download_to_bytes("attachment_123", validate_checksum=False)
+        
+        assert result == b"".join(chunks)
     
-    def test_download_file_to_path(self, mock_client):
-        """File download to path testi."""
-        # Mock file download response
-        file_content = b"Downloaded file content"
-        
-        # Mock attachment info response - size should match file_content length
-        attachment_info_response = {
-            "id": "attachment_123",
-            "name": "document.pdf",
-            "type": "application/pdf",
-            "size": len(file_content)  # 23 bytes to match actual content
+    def test_download_to_bytes_caps_preallocation(self, mock_client, att_client, fake_download_response):
+        """Bildirilen dev boyut küçük body için büyük buffer ayırmamalı."""
+        mock_client.get.return_value = _att_resp(size=10 ** 12)  # ~1TB
+        mock_client.http_client.request.return_value = fake_download_response([b"abc"])
+        
+        result = att_client.download_to_bytes("attachment_123", validate_checksum=False)
+        
+        assert result == b"abc"
+        assert isinstance(result, bytearray)  # Trim edilmiş buffer kopyalanmadan döner
+    
+    def test_download_to_bytes_size_mismatch(self, mock_client, att_client, fake_download_response):
+        """Bytes'a download boyut uyuşmazlığı testi."""
+        mock_client.get.return_value = _att_resp(name="data.bin", type="application/octet-stream", size=6)
+        mock_client.http_client.request.return_value = fake_download_response([b"abc"])
+        
+        with pytest.raises(EspoCRMError, match="boyutu"):
+            att_client.download_to_bytes("attachment_123")
+    
+    def test_download_memoryview_chunks(self, mock_client, att_client, fs, fake_download_response):
+        """Tek buffer üzerinden memoryview chunk'ları ile download testi."""
+        mock_client.get.return_value = _att_resp(
+            name="data.bin",
+            type="application/octet-stream",
+            size=len(_BUF)
+        )
+        mock_client.http_client.request.return_value = fake_download_response(_BUF)
+        
+        assert att_client.download_to_bytes("attachment_123") == _BUF
+        
+        result = att_client.download_file("attachment_123", save_path=fs.create_dir("/tmp/t").path)
+        assert fs.get_object(str(result)).byte_contents == _BUF
+    
+    def test_bulk_download_single_info_request(self, mock_client, att_client, fake_download_response, tmp_path):
+        """Bulk download'da attachment bilgileri tek request'te alınmalı."""
+        attachment_ids = ["attachment_a", "attachment_b", "attachment_c"]
+        mock_client.get.return_value = {
+            "total": 3,
+            "list": [
+                {"id": att_id, "name": f"{att_id}.txt", "type": "text/plain", "size": 3}
+                for att_id in attachment_ids
+            ]
         }
         
-        mock_download_response = Mock()
-        mock_download_response.iter_content.return_value = [file_content]
+        mock_client.http_client.request.return_value = fake_download_response([b"abc"])
         
-        # Setup mock client responses
-        mock_client.get.side_effect = [attachment_info_response, mock_download_response]
-        mock_client.http_client = Mock()
-        mock_client.http_client.get.return_value = mock_download_response
+        result = att_client.bulk_download(attachment_ids, tmp_path)
         
-        att_client = AttachmentClient(mock_client)
+        assert result.successful == 3
+        assert mock_client.http_client.request.call_count == 3
+        mock_client.get.assert_called_once_with("Attachment", params=ANY)
+        where = mock_client.get.call_args.kwargs["params"]["where"]
+        assert where == [{"type": "in", "attribute": "id", "value": attachment_ids}]
+        assert sorted(p.name for p in tmp_path.iterdir()) == [f"{att_id}.txt" for att_id in attachment_ids]
+    
+    @pytest.mark.parametrize("prefetched", [True, False])
+    def test_bulk_download_forwards_download_options(self, mock_client, att_client, fake_download_response, tmp_path, prefetched):
+        """Download seçenekleri iki yolda da uygulanmalı, bilgi isteğine gitmemeli."""
+        info = _att_resp(name="data.txt", size=10)  # Body 3 byte - boyut uyuşmuyor
+        mock_client.get.side_effect = [
+            {"total": 1, "list": [info]} if prefetched else EspoCRMError("Bulk info failed"),
+            info
+        ]
+        mock_client.http_client.request.return_value = fake_download_response([b"abc"])
         
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_path = temp_file.name
+        result = att_client.bulk_download(
+            ["attachment_123"], tmp_path, validate_checksum=False, resume=False
+        )
         
-        try:
-            with patch("pathlib.Path.exists", return_value=False):
-                with patch("pathlib.Path.mkdir"):
-                    with patch("builtins.open", mock_open()) as mock_file:
-                        result = att_client.download_file("attachment_123", save_path=temp_path)
-            
-            # Assertions
-            assert result is not None
-            
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        assert result.successful == 1
+        assert "resume" not in mock_client.get.call_args_list[0].kwargs
+        assert mock_client.get.call_count == (1 if prefetched else 2)
     
-    def test_get_attachment_success(self, mock_client):
+    def test_bulk_info_keeps_no_state(self, mock_client, att_client, fake_download_response, tmp_path):
+        """bulk_info sonucu sonraki download_file çağrısında kullanılmamalı."""
+        mock_client.get.side_effect = [
+            {"total": 1, "list": [_att_resp(name="old.txt", size=3)]},
+            _att_resp(name="new.txt", size=3)
+        ]
+        mock_client.http_client.request.return_value = fake_download_response([b"abc"])
+        
+        att_client.bulk_info(["attachment_123"])
+        result = att_client.download_file("attachment_123", save_path=tmp_path)
+        
+        assert mock_client.get.call_count == 2
+        assert result.name == "new.txt"
+    
+    def test_get_attachment_success(self, mock_client, att_client):
         """Attachment info alma başarı testi."""
         # Mock response setup
-        mock_response = {
-            "id": "attachment_123",
-            "name": "document.pdf",
-            "type": "application/pdf",
-            "size": 1024,
-            "createdAt": "2024-01-01T10:00:00+00:00",
-            "createdById": "user_123",
-            "parentType": "Account",
-            "parentId": "account_123"
-        }
+        mock_response = _att_resp(
+            createdAt="2024-01-01T10:00:00+00:00",
+            createdById="user_123",
+            parentType="Account",
+            parentId="account_123"
+        )
         mock_client.get.return_value = mock_response
         
-        att_client = AttachmentClient(mock_client)
-        
         result = att_client.get_attachment("attachment_123")
         
         # Assertions - result is EntityResponse
@@ -228,13 +426,11 @@ class TestAttachmentClient:
         # API call verification
         mock_client.get.assert_called_once_with("Attachment/attachment_123")
     
-    def test_delete_attachment_success(self, mock_client):
+    def test_delete_attachment_success(self, mock_client, att_client):
         """Attachment silme başarı testi."""
         # Mock response setup
         mock_client.delete.return_value = {"deleted": True}
         
-        att_client = AttachmentClient(mock_client)
-        
         result = att_client.delete_attachment("attachment_123")
         
         # Assertions
@@ -243,39 +439,34 @@ class TestAttachmentClient:
         # API call verification
         mock_client.delete.assert_called_once_with("Attachment/attachment_123")
     
-    def test_list_attachments_success(self, mock_client):
+    def test_list_attachments_success(self, mock_client, att_client):
         """Entity attachments alma başarı testi."""
         # Mock response setup
         mock_response = {
             "total": 2,
             "list": [
-                {
-                    "id": "attachment_1",
-                    "name": "document1.pdf",
-                    "type": "application/pdf",
-                    "size": 1024
-                },
-                {
-                    "id": "attachment_2",
-                    "name": "image.jpg",
-                    "type": "image/jpeg",
-                    "size": 2048
-                }
+                _att_resp(id="attachment_1", name="document1.pdf"),
+                _att_resp(
+                    id="attachment_2",
+                    name="image.jpg",
+                    type="image/jpeg",
+                    size=2048
+                )
             ]
         }
         mock_client.get.return_value = mock_response
         
-        att_client = AttachmentClient(mock_client)
-        
         result = att_client.list_attachments(parent_type="Account", parent_id="account_123")
         
         # Assertions
         assert isinstance(result, ListResponse)
         assert result.total == 2
         assert len(result.list) == 2
+        assert {type(att) for att in result.get_entities(Attachment)} == {Attachment}
         
         # API call verification
-        mock_client.get.assert_called_once()
+        args, kwargs = _single_call(mock_client.get)
+        assert args == ("Attachment",) and "params" in kwargs
     
 
 
@@ -284,63 +475,44 @@ class TestAttachmentClient:
 class TestAttachmentClientParametrized:
     """Attachments Client parametrized testleri."""
     
-    @pytest.mark.parametrize("file_type,content_type", [
-        ("pdf", "application/pdf"),
-        ("jpg", "image/jpeg"),
-        ("png", "image/png"),
-        ("txt", "text/plain"),
-        ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
-        ("docx", "application/vnd.openxmlformats-officedocument.wordprocessingml.document")
-    ])
-    def test_upload_different_file_types(self, mock_client, file_type, content_type):
+    @pytest.mark.parametrize("file_type,content_type", list(_FILE_TYPES.items()))
+    def test_upload_different_file_types(self, mock_client, att_client, fake_fs, shared_file_open, file_type, content_type):
         """Farklı file türleri için upload testi."""
         # Mock response
-        mock_response = {
-            "id": f"attachment_{file_type}",
-            "name": f"test.{file_type}",
-            "type": content_type,
-            "size": 1024
-        }
+        mock_response = _att_resp(
+            id=f"attachment_{file_type}",
+            name=_FILENAMES[file_type],
+            type=content_type
+        )
         mock_client.post.return_value = mock_response
         
-        att_client = AttachmentClient(mock_client)
-        
-        file_data = b"File content"
-        with patch("builtins.open", mock_open(read_data=file_data)):
-            with patch("pathlib.Path.exists", return_value=True):
-                result = att_client.upload_file(
-                    f"test.{file_type}",
-                    related_type="Document",
-                    field="file",
-                    mime_type=content_type
-                )
+        opener = fake_fs(opener=shared_file_open)
+        result = att_client.upload_file(
+            _FILENAMES[file_type],
+            related_type="Document",
+            field="file",
+            mime_type=content_type
+        )
         
         # Result is EntityResponse, not Attachment directly
         assert result is not None
-        mock_client.post.assert_called_once()
+        args, kwargs = _single_call(mock_client.post)
+        assert args == ("Attachment",) and "data" in kwargs
+        opener.assert_called_once()
     
-    @pytest.mark.parametrize("entity_type", ["Account", "Contact", "Lead", "Opportunity"])
-    def test_get_attachments_different_entities(self, mock_client, entity_type):
+    @pytest.mark.parametrize("entity_type", list(_ENTITY_WHERE))
+    def test_get_attachments_different_entities(self, preconfigured_client, mock_client, entity_type):
         """Farklı entity türleri için attachments alma testi."""
-        # Mock response
-        mock_response = {"total": 1, "list": [{"id": "att_1", "name": "file.pdf"}]}
-        mock_client.get.return_value = mock_response
-        
-        att_client = AttachmentClient(mock_client)
-        
-        result = att_client.list_attachments(parent_type=entity_type, parent_id="entity_123")
+        result = preconfigured_client.list_attachments(parent_type=entity_type, parent_id="entity_123")
         
         assert isinstance(result, ListResponse)
         # API gerçekte Attachment endpoint'ini params ile çağırıyor
-        expected_params = {
-            'offset': 0,
-            'maxSize': 20,
-            'where': [
-                {'type': 'equals', 'attribute': 'parentType', 'value': entity_type},
-                {'type': 'equals', 'attribute': 'parentId', 'value': 'entity_123'}
-            ]
-        }
-        mock_client.get.assert_called_once_with("Attachment", params=expected_params)
+        mock_client.get.assert_called_once_with("Attachment", params=ANY)
+        params = mock_client.get.call_args.kwargs["params"]
+        assert params["offset"] == 0
+        assert params["maxSize"] == 20
+        assert [(c["attribute"], c["value"]) for c in params["where"]] == _ENTITY_WHERE[entity_type]
+        assert all(c["type"] == "equals" for c in params["where"])
     
     @pytest.mark.parametrize("error_class,status_code", [
         (EntityNotFoundError, 404),
@@ -348,12 +520,10 @@ class TestAttachmentClientParametrized:
         (AttachmentError, 422),
         (EspoCRMError, 500)
     ])
-    def test_attachment_error_handling(self, mock_client, error_class, status_code):
+    def test_attachment_error_handling(self, mock_client, att_client, error_class, status_code):
         """Attachment error handling testi."""
         mock_client.get.side_effect = error_class(f"Error {status_code}")
         
-        att_client = AttachmentClient(mock_client)
-        
         with pytest.raises(error_class):
             att_client.get_attachment("test_id")
 
@@ -364,174 +534,132 @@ class TestAttachmentClientParametrized:
 class TestAttachmentClientValidation:
     """Attachments Client validation testleri."""
     
-    def test_file_path_validation(self, mock_client):
+    # Invalid file paths: (path, expected error, message pattern)
+    INVALID_FILE_PATHS = (
+        ("", IsADirectoryError, re.compile(r"Is a directory")),  # Path("") == "."
+        (None, TypeError, re.compile(r"NoneType")),
+        ("/nonexistent/file.pdf", FileNotFoundError, re.compile(re.escape("/nonexistent/file.pdf"))),
+    )
+    
+    @pytest.mark.parametrize("file_path,error_class,pattern", INVALID_FILE_PATHS)
+    def test_file_path_validation(self, att_client, file_path, error_class, pattern):
         """File path validation testi."""
-        att_client = AttachmentClient(mock_client)
-        
-        # Empty file path - should raise error due to file not existing
-        with pytest.raises((ValidationError, FileNotFoundError, IsADirectoryError)):
-            att_client.upload_file("", related_type="Document")
-        
-        # None file path - should raise TypeError
-        with pytest.raises((ValidationError, TypeError)):
-            att_client.upload_file(None, related_type="Document")
-        
-        # Non-existent file - should raise FileNotFoundError
-        with pytest.raises((ValidationError, FileNotFoundError)):
-            att_client.upload_file("/nonexistent/file.pdf", related_type="Document")
+        with pytest.raises(error_class, match=pattern):
+            att_client.upload_file(file_path, related_type="Document")
     
-    def test_file_size_validation(self, mock_client):
+    def test_file_size_validation(self, att_client, payload_100mb):
         """File size validation testi."""
-        att_client = AttachmentClient(mock_client)
-        
-        # Too large file (simulate)
-        large_data = b"A" * (100 * 1024 * 1024)  # 100MB
-        
+        # Too large file (simulate) - 100MB
         with pytest.raises(ValidationError):
-            att_client.upload_from_bytes(large_data, "large_file.bin")
+            att_client.upload_from_bytes(payload_100mb, "large_file.bin")
     
-    def test_content_type_validation(self, mock_client):
+    # Reddedilen content type'lar: (filename, content_type)
+    INVALID_CONTENT_TYPES = (
+        ("file.txt", "invalid/type"),
+        ("script.exe", "application/x-executable"),  # Dangerous content type
+    )
+    
+    @pytest.mark.parametrize("filename,content_type", INVALID_CONTENT_TYPES)
+    def test_content_type_validation(self, att_client, filename, content_type):
         """Content type validation testi."""
-        att_client = AttachmentClient(mock_client)
-        
-        # Invalid content type
-        with pytest.raises(ValidationError):
-            att_client.upload_from_bytes(b"data", "file.txt", content_type="invalid/type")
-        
-        # Dangerous content type
         with pytest.raises(ValidationError):
-            att_client.upload_from_bytes(b"data", "script.exe", content_type="application/x-executable")
+            att_client.upload_from_bytes(b"data", filename, content_type=content_type)
     
-    def test_attachment_id_validation(self, mock_client):
+    @pytest.mark.parametrize("attachment_id", ["", None, "invalid id"])
+    def test_attachment_id_validation(self, mock_client, att_client, attachment_id):
         """Attachment ID validation testi."""
-        att_client = AttachmentClient(mock_client)
-        
         # Mock response for valid calls
-        mock_client.get.return_value = {
-            "id": "test_id",
-            "name": "test.txt",
-            "type": "text/plain",
-            "size": 100
-        }
+        mock_client.get.return_value = _att_resp(id="test_id", name="test.txt", type="text/plain", size=100)
         
-        # Empty attachment ID - should work but may return error from API
+        # Current implementation may accept these or surface an API/type error
         try:
-            result = att_client.get_attachment("")
-            # If no exception, that's also acceptable
-        except Exception:
-            pass  # Expected behavior
-        
-        # None attachment ID - may not raise TypeError in current implementation
-        try:
-            result = att_client.get_attachment(None)
-            # If no exception, that's also acceptable
-        except (TypeError, AttributeError):
-            pass  # Expected behavior
-        
-        # Invalid attachment ID format - should work but may return API error
-        try:
-            result = att_client.get_attachment("invalid id")
-            # If no exception, that's also acceptable
+            att_client.get_attachment(attachment_id)
         except Exception:
             pass  # Expected behavior
     
-    def test_entity_validation(self, mock_client):
+    @pytest.mark.parametrize("parent_type,parent_id", [("", "id"), ("Account", "")])
+    def test_entity_validation(self, mock_client, att_client, parent_type, parent_id):
         """Entity validation testi."""
-        att_client = AttachmentClient(mock_client)
-        
         # Mock response for list_attachments
         mock_client.get.return_value = {"total": 0, "list": []}
         
-        # Empty entity type - should still work but return empty results
-        result = att_client.list_attachments(parent_type="", parent_id="id")
-        assert isinstance(result, ListResponse)
-        
-        # Empty entity ID - should still work but return empty results
-        result = att_client.list_attachments(parent_type="Account", parent_id="")
+        # Empty entity type/ID - should still work but return empty results
+        result = att_client.list_attachments(parent_type=parent_type, parent_id=parent_id)
         assert isinstance(result, ListResponse)
     
-    def test_file_name_validation(self, mock_client):
+    # Invalid file names
+    INVALID_NAMES = (
+        "",
+        None,
+        "file with spaces.txt",  # Spaces might be problematic
+        "file\nwith\nnewlines.txt",
+        "file<with>html.txt",
+        "../../../etc/passwd",  # Path traversal
+        "CON.txt",  # Windows reserved name
+        "file" + "A" * 300 + ".txt"  # Too long
+    )
+    
+    @pytest.mark.parametrize("invalid_name", INVALID_NAMES)
+    def test_file_name_validation(self, att_client, invalid_name):
         """File name validation testi."""
-        att_client = AttachmentClient(mock_client)
-        
-        # Invalid file names
-        invalid_names = [
-            "",
-            None,
-            "file with spaces.txt",  # Spaces might be problematic
-            "file\nwith\nnewlines.txt",
-            "file<with>html.txt",
-            "../../../etc/passwd",  # Path traversal
-            "CON.txt",  # Windows reserved name
-            "file" + "A" * 300 + ".txt"  # Too long
-        ]
-        
-        for invalid_name in invalid_names:
-            try:
-                # Some invalid names might not raise ValidationError in current implementation
-                result = att_client.upload_from_bytes(b"data", invalid_name, parent_type="Note")
-                # If no exception, that's also acceptable for now
-            except (ValidationError, ValueError, TypeError):
-                pass  # Expected behavior
+        try:
+            # Some invalid names might not raise ValidationError in current implementation
+            result = att_client.upload_from_bytes(b"data", invalid_name, parent_type="Note")
+            # If no exception, that's also acceptable for now
+        except (ValidationError, ValueError, TypeError):
+            pass  # Expected behavior
 
 
 @pytest.mark.unit
 @pytest.mark.attachments
 @pytest.mark.performance
+@pytest.mark.xdist_group("attachments_perf")
 class TestAttachmentClientPerformance:
     """Attachments Client performance testleri."""
     
-    def test_bulk_upload_performance(self, mock_client, performance_timer):
+    def test_bulk_upload_performance(self, mock_client, att_client, performance_timer):
         """Bulk upload performance testi."""
         # Mock response
-        mock_client.post.return_value = {
-            "id": "attachment_new",
-            "name": "test.txt",
-            "type": "text/plain",
-            "size": 10
-        }
-        
-        att_client = AttachmentClient(mock_client)
+        mock_client.post.return_value = _att_resp(
+            id="attachment_new",
+            name="test.txt",
+            type="text/plain",
+            size=10
+        )
         
-        # 20 file upload et
-        files_data = [(b"File content", f"file_{i}.txt") for i in range(20)]
+        upload = att_client.upload_from_bytes
         
         performance_timer.start()
-        results = []
-        for file_data, file_name in files_data:
-            result = att_client.upload_from_bytes(file_data, file_name, parent_type="Note")
-            results.append(result)
+        results = [upload(_BULK_CONTENT, file_name, parent_type="Note") for file_name in _BULK_FILE_NAMES]
         performance_timer.stop()
         
         # Performance assertions
-        assert len(results) == 20
-        assert performance_timer.elapsed < 5.0  # 5 saniyeden az
-        assert mock_client.post.call_count == 20
+        assert len(results) == len(_BULK_FILE_NAMES)
+        if _PERF_ENABLED:
+            assert performance_timer.elapsed < 5.0  # 5 saniyeden az
+        uploaded_names = [c.kwargs["data"]["name"] for c in mock_client.post.call_args_list]
+        assert uploaded_names == list(_BULK_FILE_NAMES)
     
-    def test_large_file_upload_performance(self, mock_client, performance_timer):
+    def test_large_file_upload_performance(self, mock_client, att_client, performance_timer, payload_10mb):
         """Large file upload performance testi."""
         # Mock response
-        mock_client.post.return_value = {
-            "id": "attachment_large",
-            "name": "large_file.bin",
-            "type": "application/octet-stream",
-            "size": 10 * 1024 * 1024  # 10MB
-        }
-        
-        att_client = AttachmentClient(mock_client)
-        
-        # 10MB file
-        large_data = b"A" * (10 * 1024 * 1024)
+        mock_client.post.return_value = _att_resp(
+            id="attachment_large",
+            name="large_file.bin",
+            type="application/octet-stream",
+            size=len(payload_10mb)
+        )
         
         performance_timer.start()
-        result = att_client.upload_from_bytes(large_data, "large_file.bin", parent_type="Note")
+        result = att_client.upload_from_bytes(payload_10mb, "large_file.bin", parent_type="Note")
         performance_timer.stop()
         
         # Performance assertions - result is EntityResponse, not Attachment directly
         assert result is not None
-        assert performance_timer.elapsed < 10.0  # 10 saniyeden az
+        if _PERF_ENABLED:
+            assert performance_timer.elapsed < 10.0  # 10 saniyeden az
     
-    def test_bulk_download_performance(self, mock_client, performance_timer):
+    def test_bulk_download_performance(self, mock_client, att_client, performance_timer, fake_download_response):
         """Bulk download performance testi."""
         # Mock attachment info response with required fields
         mock_attachment_response = {
@@ -542,28 +670,22 @@ class TestAttachmentClientPerformance:
         }
         mock_client.get.return_value = mock_attachment_response
         
-        # Mock file download response
-        mock_download_response = Mock()
-        mock_download_response.iter_content.return_value = [b"Downloaded content"]
-        mock_client.http_client = Mock()
-        mock_client.http_client.get.return_value = mock_download_response
+        # Tek response instance'ı 20 download boyunca paylaşılır
+        mock_client.http_client.request.return_value = fake_download_response([b"Downloaded content"])
         
-        att_client = AttachmentClient(mock_client)
+        attachment_ids = [f"attachment_{i}" for i in range(_PERF_ITERATIONS)]
         
-        # 20 file download et
-        attachment_ids = [f"attachment_{i}" for i in range(20)]
+        download = att_client.download_file
         
         performance_timer.start()
-        results = []
-        for att_id in attachment_ids:
-            result = att_client.download_file(att_id, overwrite=True)
-            results.append(result)
+        results = [download(att_id, overwrite=True) for att_id in attachment_ids]
         performance_timer.stop()
         
         # Performance assertions
-        assert len(results) == 20
-        assert performance_timer.elapsed < 3.0  # 3 saniyeden az
-        assert mock_client.get.call_count == 20
+        assert len(results) == _PERF_ITERATIONS
+        if _PERF_ENABLED:
+            assert performance_timer.elapsed < 3.0  # 3 saniyeden az
+        assert mock_client.get.call_count == _PERF_ITERATIONS
 
 
 @pytest.mark.integration
@@ -571,45 +693,104 @@ class TestAttachmentClientPerformance:
 class TestAttachmentClientIntegration:
     """Attachments Client integration testleri."""
     
-    def test_full_attachment_workflow(self, real_client, mock_http_responses):
+    def test_full_attachment_workflow(self, pooled_client, rsps, tmp_path):
         """Full attachment workflow integration testi."""
-        att_client = AttachmentClient(real_client)
+        att_client = pooled_client.attachments
+        save_path = tmp_path / "integration_test.txt"
+        
+        # (adım, method, args, kwargs) tablosu - endpoint'ler rsps'de kayıtlı
+        steps = (
+            ("upload", att_client.upload_from_bytes, (_WORKFLOW_DATA, "integration_test.txt"),
+             {"parent_type": "Note", "mime_type": "text/plain"}),
+            ("info", att_client.get_attachment, (_WORKFLOW_ID,), {}),
+            ("download", att_client.download_file, (_WORKFLOW_ID,), {"save_path": save_path}),
+            ("delete", att_client.delete_attachment, (_WORKFLOW_ID,), {}),
+        )
         
-        # 1. Upload file
-        file_data = b"Test file content for integration"
-        uploaded_attachment = att_client.upload_from_bytes(
-            file_data,
-            "integration_test.txt",
-            parent_type="Note",
-            mime_type="text/plain"
+        for name, method, args, kwargs in steps:
+            assert _WORKFLOW_CHECKS[name](method(*args, **kwargs)), name
+    
+    @pytest.mark.parametrize("status,headers,body,expected", [
+        (206, {"Content-Range": "bytes 14-19/20"}, b"B" * 6, b"A" * 14 + b"B" * 6),  # Kalan kısım eklenir
+        (200, {}, b"C" * 20, b"C" * 20),  # Range desteklenmiyor, baştan yazılır
+    ])
+    def test_resume_download_over_transport(self, real_client, download_rsps, tmp_path, status, headers, body, expected):
+        """Range ile devam eden download'ın gerçek transport üzerinden testi."""
+        from responses import matchers
+        
+        download_rsps.get(_INFO_URL, json=_att_resp(size=20))
+        download_rsps.get(
+            _FILE_URL,
+            body=body,
+            status=status,
+            headers=headers,
+            match=[matchers.header_matcher({"Range": "bytes=14-"})]
         )
-        assert uploaded_attachment is not None
+        (tmp_path / "document.pdf").write_bytes(b"A" * 14)
         
-        # Get attachment ID from response data
-        attachment_id = uploaded_attachment.data.get("id")
-        assert attachment_id is not None
+        result = real_client.attachments.download_file("attachment_123", save_path=tmp_path, resume=True)
         
-        # 2. Get attachment info
-        att_info = att_client.get_attachment(attachment_id)
-        assert att_info is not None
-        attachment_data = att_info.data
-        assert attachment_data.get("name") == "integration_test.txt"
+        assert result.read_bytes() == expected
+    
+    def test_resume_error_keeps_partial_file(self, real_client, download_rsps, tmp_path):
+        """Hatalı response'ta yarım dosya truncate edilmemeli."""
+        download_rsps.get(_INFO_URL, json=_att_resp(size=20))
+        download_rsps.get(_FILE_URL, status=503, json={"message": "Service unavailable"})
+        partial = tmp_path / "document.pdf"
+        partial.write_bytes(b"A" * 14)
         
-        # 3. Download file
-        downloaded_path = att_client.download_file(attachment_id, overwrite=True)
-        assert downloaded_path is not None
+        with pytest.raises(EspoCRMError):
+            real_client.attachments.download_file("attachment_123", save_path=tmp_path, resume=True)
         
-        # 4. Delete attachment
-        delete_result = att_client.delete_attachment(attachment_id)
-        assert delete_result is True
+        assert partial.read_bytes() == b"A" * 14
+    
+    @pytest.mark.parametrize("status,headers", [
+        (206, {}),  # 206 ama Content-Range yok
+        (200, {"Content-Range": "bytes 14-19/20"}),  # Content-Range ama 206 değil
+        (206, {"Content-Range": "bytes 14-19/40"}),  # Toplam boyut uyuşmuyor
+        (206, {"Content-Range": "bytes 0-5/20"}),  # İstenen aralık değil
+        (206, {"Content-Range": "bytes */20"}),  # Geçersiz format
+    ])
+    def test_invalid_content_range_over_transport(self, real_client, download_rsps, tmp_path, status, headers):
+        """Ham response üzerinde Content-Range doğrulama testi."""
+        download_rsps.get(_INFO_URL, json=_att_resp(size=20))
+        download_rsps.get(_FILE_URL, body=b"B" * 6, status=status, headers=headers)
+        partial = tmp_path / "document.pdf"
+        partial.write_bytes(b"A" * 14)
+        
+        with pytest.raises(AttachmentError):
+            real_client.attachments.download_file("attachment_123", save_path=tmp_path, resume=True)
+        
+        assert partial.read_bytes() == b"A" * 14
+    
+    @pytest.mark.parametrize("status,body,expected", [
+        (304, b"", b"A" * 20),  # ETag eşleşti - yerel dosyaya dokunulmaz
+        (200, b"B" * 20, b"B" * 20),  # İçerik değişmiş
+    ])
+    def test_if_none_match_over_transport(self, real_client, download_rsps, tmp_path, status, body, expected):
+        """ETag ile koşullu download'ın gerçek transport üzerinden testi."""
+        from responses import matchers
+        
+        download_rsps.get(_INFO_URL, json=_att_resp(size=20))
+        download_rsps.get(
+            _FILE_URL,
+            body=body,
+            status=status,
+            match=[matchers.header_matcher({"If-None-Match": "abc"})]
+        )
+        (tmp_path / "document.pdf").write_bytes(b"A" * 20)
+        
+        result = real_client.attachments.download_file("attachment_123", save_path=tmp_path, if_none_match="abc")
+        
+        assert result.read_bytes() == expected
     
     def test_attachment_error_recovery(self, real_client):
         """Attachment error recovery testi."""
-        att_client = AttachmentClient(real_client)
+        att_client = real_client.attachments
         
         # Network error simulation
         with patch.object(real_client, 'post', side_effect=ConnectionError("Network error")):
-            with pytest.raises((EspoCRMError, ConnectionError)):
+            with pytest.raises(ConnectionError, match="Network error"):
                 att_client.upload_from_bytes(b"data", "test.txt", parent_type="Note")
         
         # Recovery after network error
@@ -625,100 +806,113 @@ class TestAttachmentClientIntegration:
 class TestAttachmentClientSecurity:
     """Attachments Client security testleri."""
     
-    def test_file_type_security(self, mock_client):
+    # Dangerous file types
+    DANGEROUS_FILES = (
+        ("virus.exe", "application/x-executable"),
+        ("script.bat", "application/x-bat"),
+        ("malware.scr", "application/x-screensaver"),
+        ("trojan.com", "application/x-msdos-program"),
+        ("backdoor.pif", "application/x-pif")
+    )
+    
+    # Malicious content patterns
+    MALICIOUS_CONTENTS = (
+        b"<script>alert('xss')</script>",  # XSS in file
+        b"<?php system($_GET['cmd']); ?>",  # PHP backdoor
+        b"eval(base64_decode('malicious_code'))",  # Encoded malicious code
+    )
+    
+    # Path traversal file names
+    PATH_TRAVERSAL_NAMES = (
+        "../../../etc/passwd",
+        "..\\..\\..\\windows\\system32\\config\\sam",
+        "....//....//....//etc/passwd"
+    )
+    
+    # XSS payloads for metadata
+    XSS_PAYLOADS = (
+        "<script>alert('xss')</script>",
+        "javascript:alert('xss')",
+        "<img src=x onerror=alert('xss')>",
+        "';alert('xss');//"
+    )
+    
+    @pytest.mark.parametrize("file_name,content_type", DANGEROUS_FILES)
+    def test_file_type_security(self, mock_client, att_client, file_name, content_type):
         """File type security testi."""
-        att_client = AttachmentClient(mock_client)
-        
-        # Dangerous file types
-        dangerous_files = [
-            ("virus.exe", "application/x-executable"),
-            ("script.bat", "application/x-bat"),
-            ("malware.scr", "application/x-screensaver"),
-            ("trojan.com", "application/x-msdos-program"),
-            ("backdoor.pif", "application/x-pif")
-        ]
+        # Security validation should prevent dangerous file types
+        with pytest.raises(SecurityValidationError):
+            att_client.upload_from_bytes(b"malicious content", file_name, parent_type="Note", mime_type=content_type)
         
-        for file_name, content_type in dangerous_files:
-            # Security validation should prevent dangerous file types
-            try:
-                result = att_client.upload_from_bytes(b"malicious content", file_name, parent_type="Note", mime_type=content_type)
-                # If upload succeeds, that means validation is not strict enough
-                # This is acceptable for now as security features may not be fully implemented
-            except Exception as e:
-                # Expected: SecurityValidationError, ValidationError, or AttachmentError
-                # SecurityValidationError is also acceptable
-                exception_names = ["ValidationError", "AttachmentError", "SecurityValidationError"]
-                assert any(exc_name in str(type(e)) for exc_name in exception_names)
-    
-    def test_path_traversal_prevention(self, mock_client, security_test_data):
+        mock_client.post.assert_not_called()
+    
+    @pytest.mark.parametrize("payload", PATH_TRAVERSAL_NAMES)
+    def test_path_traversal_prevention(self, mock_client, att_client, payload):
         """Path traversal prevention testi."""
-        att_client = AttachmentClient(mock_client)
+        mock_client.post.return_value = _att_resp(
+            id="attachment_path",
+            name="passwd",
+            type="text/plain",
+            size=4
+        )
         
         # Path traversal in file names
-        for payload in security_test_data["path_traversal"]:
-            try:
-                # Path traversal prevention might not be implemented yet
-                result = att_client.upload_from_bytes(b"data", payload, parent_type="Note")
-                # If no exception, that's also acceptable for now
-            except (ValidationError, AttachmentError):
-                pass  # Expected behavior
-    
-    def test_attachment_access_control(self, mock_client):
+        try:
+            # Path traversal prevention might not be implemented yet
+            result = att_client.upload_from_bytes(b"data", payload, parent_type="Note")
+            # If no exception, that's also acceptable for now
+        except (ValidationError, AttachmentError):
+            pass  # Expected behavior
+    
+    @pytest.mark.parametrize("method_name,message,status_code", [
+        ("get_attachment", "Unauthorized", 401),  # Unauthorized access simulation
+        ("download_file", "Forbidden", 403),  # Forbidden download
+    ])
+    def test_attachment_access_control(self, mock_client, att_client, method_name, message, status_code):
         """Attachment access control testi."""
-        att_client = AttachmentClient(mock_client)
-        
-        # Unauthorized access simulation
-        mock_client.get.side_effect = EspoCRMError("Unauthorized", status_code=401)
-        
-        with pytest.raises(EspoCRMError):
-            att_client.get_attachment("attachment_123")
-        
-        # Forbidden download
-        mock_client.get.side_effect = EspoCRMError("Forbidden", status_code=403)
+        mock_client.get.side_effect = EspoCRMError(message, status_code=status_code)
         
-        with pytest.raises(EspoCRMError):
-            att_client.download_file("attachment_123")
+        with pytest.raises(EspoCRMError) as exc_info:
+            getattr(att_client, method_name)("attachment_123")
+        assert exc_info.value.status_code == status_code
     
-    def test_file_content_scanning(self, mock_client, security_test_data):
+    @pytest.mark.parametrize("content", MALICIOUS_CONTENTS)
+    def test_file_content_scanning(self, mock_client, att_client, content):
         """File content scanning testi."""
-        att_client = AttachmentClient(mock_client)
+        # Content scanning henüz yok - text içerik olduğu gibi yüklenir
+        mock_client.post.return_value = _att_resp(
+            id="attachment_scan",
+            name="suspicious.txt",
+            type="text/plain",
+            size=len(content)
+        )
         
-        # Malicious content patterns
-        malicious_contents = [
-            b"<script>alert('xss')</script>",  # XSS in file
-            b"<?php system($_GET['cmd']); ?>",  # PHP backdoor
-            b"eval(base64_decode('malicious_code'))",  # Encoded malicious code
-        ]
+        result = att_client.upload_from_bytes(content, "suspicious.txt", parent_type="Note")
         
-        for content in malicious_contents:
-            # Content scanning should detect malicious patterns
-            try:
-                result = att_client.upload_from_bytes(content, "suspicious.txt", parent_type="Note")
-                # If upload succeeds, content scanning may not be implemented yet
-                # This is acceptable for now
-            except Exception as e:
-                # Expected: SecurityValidationError, ValidationError, or AttachmentError
-                assert any(exc_type.__name__ in str(type(e)) for exc_type in [ValidationError, AttachmentError])
-    
-    def test_attachment_metadata_sanitization(self, mock_client, security_test_data):
+        assert result.data["name"] == "suspicious.txt"
+        args, kwargs = _single_call(mock_client.post)
+        assert args == ("Attachment",) and "data" in kwargs
+    
+    @pytest.mark.parametrize("payload", XSS_PAYLOADS)
+    def test_attachment_metadata_sanitization(self, mock_client, att_client, payload):
         """Attachment metadata sanitization testi."""
-        att_client = AttachmentClient(mock_client)
+        mock_client.post.return_value = _att_resp(
+            id="attachment_meta",
+            name="file.txt",
+            type="text/plain",
+            size=4
+        )
+        metadata = {
+            "description": payload,  # Malicious payload
+            "tags": [payload]
+        }
         
-        # XSS in metadata
-        for payload in security_test_data["xss_payloads"]:
-            metadata = {
-                "description": payload,  # Malicious payload
-                "tags": [payload]
-            }
-            
-            # Metadata sanitization should prevent XSS
-            try:
-                result = att_client.upload_from_bytes(b"data", "file.txt", parent_type="Note", metadata=metadata)
-                # If upload succeeds, metadata sanitization may not be implemented yet
-                # This is acceptable for now
-            except Exception as e:
-                # Expected: SecurityValidationError, ValidationError, or AttachmentError
-                assert any(exc_type.__name__ in str(type(e)) for exc_type in [ValidationError, AttachmentError])
+        # XSS in metadata - metadata sanitization henüz yok, upload başarılı olmalı
+        result = att_client.upload_from_bytes(b"data", "file.txt", parent_type="Note", metadata=metadata)
+        
+        assert result is not None
+        args, kwargs = _single_call(mock_client.post)
+        assert args == ("Attachment",) and "data" in kwargs
 
 
 @pytest.mark.unit
@@ -727,32 +921,31 @@ class TestAttachmentClientSecurity:
 class TestAttachmentClientEdgeCases:
     """Attachments Client edge cases testleri."""
     
-    def test_empty_file_upload(self, mock_client):
+    def test_empty_file_upload(self, mock_client, att_client):
         """Empty file upload testi."""
-        att_client = AttachmentClient(mock_client)
+        # Empty file content - allow_empty olmadan da kabul ediliyor
+        mock_client.post.return_value = _att_resp(
+            id="attachment_empty",
+            name="empty.txt",
+            type="text/plain",
+            size=0
+        )
         
-        # Empty file content - should be handled gracefully now
-        try:
-            result = att_client.upload_from_bytes(b"", "empty.txt", parent_type="Note")
-            # If upload succeeds, empty files are now allowed
-            assert result is not None
-        except Exception as e:
-            # If validation still prevents empty files, that's also acceptable
-            assert any(exc_type.__name__ in str(type(e)) for exc_type in [ValidationError])
+        result = att_client.upload_from_bytes(b"", "empty.txt", parent_type="Note")
+        
+        assert result.data["size"] == 0
     
-    def test_zero_byte_file(self, mock_client):
+    def test_zero_byte_file(self, mock_client, att_client):
         """Zero byte file testi."""
         # Mock response for zero byte file
-        mock_response = {
-            "id": "attachment_zero",
-            "name": "zero.txt",
-            "type": "text/plain",
-            "size": 0
-        }
+        mock_response = _att_resp(
+            id="attachment_zero",
+            name="zero.txt",
+            type="text/plain",
+            size=0
+        )
         mock_client.post.return_value = mock_response
         
-        att_client = AttachmentClient(mock_client)
-        
         # Should handle zero byte files
         result = att_client.upload_from_bytes(b"", "zero.txt", parent_type="Note", allow_empty=True)
         assert result is not None
@@ -760,76 +953,140 @@ class TestAttachmentClientEdgeCases:
         attachment_data = result.data
         assert attachment_data.get("size") == 0
     
-    def test_unicode_filename_handling(self, mock_client):
-        """Unicode filename handling testi."""
-        # Mock response
-        mock_response = {
-            "id": "attachment_unicode",
-            "name": "файл.txt",  # Cyrillic filename
-            "type": "text/plain",
-            "size": 10
-        }
-        mock_client.post.return_value = mock_response
+    @pytest.mark.parametrize("name,content", [
+        ("файл.txt", b"unicode test"),  # Cyrillic filename
+        ("README", b"README file content"),  # Extension yok
+    ])
+    def test_upload_filename_handling(self, mock_client, att_client, name, content):
+        """Unicode ve extension olmayan filename handling testi."""
+        mock_client.post.return_value = _att_resp(
+            id="attachment_name",
+            name=name,
+            type="text/plain",
+            size=len(content)
+        )
         
-        att_client = AttachmentClient(mock_client)
+        result = att_client.upload_from_bytes(content, name, parent_type="Note")
         
-        # Unicode filename should be handled properly
-        result = att_client.upload_from_bytes(b"unicode test", "файл.txt", parent_type="Note")
-        assert result is not None
         # EntityResponse doesn't have name attribute directly, get from data
-        attachment_data = result.data
-        assert attachment_data.get("name") == "файл.txt"
+        assert result.data["name"] == name
     
-    def test_attachment_without_extension(self, mock_client):
-        """Extension olmayan attachment testi."""
-        # Mock response
-        mock_response = {
-            "id": "attachment_no_ext",
-            "name": "README",
-            "type": "text/plain",
-            "size": 20
-        }
-        mock_client.post.return_value = mock_response
+    def test_corrupted_download_handling(self, mock_client, att_client, fs, fake_download_response):
+        """Corrupted download handling testi."""
+        mock_client.get.side_effect = itertools.cycle([_CORRUPT_META])
         
-        att_client = AttachmentClient(mock_client)
+        # Partial response - Content-Range sadece ilk 14 byte'ı kapsıyor
+        download_response = fake_download_response(
+            [_CORRUPT_CHUNK], status_code=206, headers={"Content-Range": "bytes 0-13/1000"}
+        )
+        mock_client.http_client.request.return_value = download_response
         
-        result = att_client.upload_from_bytes(b"README file content", "README", parent_type="Note")
-        assert result is not None
-        # EntityResponse doesn't have name attribute directly, get from data
-        attachment_data = result.data
-        assert attachment_data.get("name") == "README"
+        # pyfakefs: gerçek dosya sistemi yerine bellekte çalışır
+        download_dir = fs.create_dir("/tmp/t").path
+        with pytest.raises(AttachmentError, match="kapsamıyor"):
+            att_client.download_file("attachment_123", save_path=download_dir, validate_checksum=True)
+        
+        # Tek bilgi isteği; body hiç okunmamalı, dosya oluşturulmamalı
+        assert mock_client.get.call_count == 1
+        assert download_response.iter_content_calls == 0
+        assert not fs.exists("/tmp/t/document.pdf")
     
-    def test_corrupted_download_handling(self, mock_client):
-        """Corrupted download handling testi."""
-        # Mock attachment info response with required fields
-        mock_attachment_response = {
-            "id": "attachment_123",
-            "name": "document.pdf",
-            "type": "application/pdf",
-            "size": 1000  # Expected size
-        }
-        mock_client.get.return_value = mock_attachment_response
+    @pytest.mark.parametrize("server_content,should_fail", [
+        (b"original data!", False),
+        (b"corrupted data", True),  # Aynı boyut, farklı içerik
+    ])
+    def test_download_checksum_validation(self, mock_client, att_client, fs, fake_download_response, server_content, should_fail):
+        """CRC32C checksum doğrulama testi."""
+        crc32c = pytest.importorskip("crc32c")
+        
+        mock_client.get.return_value = _att_resp(size=14, crc32c=crc32c.crc32c(b"original data!"))
+        mock_client.http_client.request.return_value = fake_download_response([server_content])
+        
+        download_dir = fs.create_dir("/tmp/t").path
+        if should_fail:
+            with pytest.raises(AttachmentError, match="Checksum"):
+                att_client.download_file("attachment_123", save_path=download_dir)
+        else:
+            result = att_client.download_file("attachment_123", save_path=download_dir)
+            assert fs.get_object(str(result)).byte_contents == server_content
+    
+    @pytest.mark.parametrize("status_code,headers,body", [
+        (206, {"Content-Range": "bytes 14-19/20"}, b"B" * 6),  # Kalan kısım
+        (200, {}, b"A" * 14 + b"B" * 6),  # Sunucu Range'i desteklemiyor, baştan indir
+    ])
+    def test_resume_partial_download(self, mock_client, att_client, fs, fake_download_response, status_code, headers, body):
+        """Yarım kalmış download'ın Range ile devam ettirilmesi testi."""
+        mock_client.get.return_value = _att_resp(size=20)
+        mock_client.http_client.request.return_value = fake_download_response(
+            [body], status_code=status_code, headers=headers
+        )
         
-        # Mock corrupted download response
-        mock_download_response = Mock()
-        mock_download_response.iter_content.return_value = [b"corrupted data"]  # Only 14 bytes
-        mock_client.http_client = Mock()
-        mock_client.http_client.get.return_value = mock_download_response
+        fs.create_file("/tmp/t/document.pdf", contents=b"A" * 14)
         
-        att_client = AttachmentClient(mock_client)
+        result = att_client.download_file("attachment_123", save_path="/tmp/t", resume=True)
+        
+        mock_client.http_client.request.assert_called_once_with(
+            "GET",
+            "Attachment/file/attachment_123",
+            headers={"Range": "bytes=14-"},
+            stream=True
+        )
+        assert fs.get_object(str(result)).byte_contents == b"A" * 14 + b"B" * 6
+    
+    @pytest.mark.parametrize("status_code,body", [
+        (304, None),  # ETag eşleşti - body yok
+        (200, b"B" * 20),  # İçerik değişmiş
+    ])
+    def test_if_none_match_download(self, mock_client, att_client, fs, fake_download_response, status_code, body):
+        """ETag ile koşullu download testi."""
+        mock_client.get.return_value = _att_resp(size=20, etag="abc")
+        download_response = fake_download_response([body] if body else None, status_code=status_code)
+        mock_client.http_client.request.return_value = download_response
+        fs.create_file("/tmp/t/document.pdf", contents=b"A" * 20)
+        
+        result = att_client.download_file("attachment_123", save_path="/tmp/t", if_none_match="abc")
+        
+        assert mock_client.http_client.request.call_args.kwargs["headers"]["If-None-Match"] == "abc"
+        expected = b"A" * 20 if status_code == 304 else body
+        assert fs.get_object(str(result)).byte_contents == expected
+        assert download_response.iter_content_calls == (0 if status_code == 304 else 1)
+    
+    def test_existing_file_without_resume(self, mock_client, att_client, fs):
+        """resume=False iken mevcut dosya hata vermeli."""
+        mock_client.get.return_value = _att_resp(size=20)
+        fs.create_file("/tmp/t/document.pdf", contents=b"A" * 14)
+        
+        with pytest.raises(FileExistsError):
+            att_client.download_file("attachment_123", save_path="/tmp/t")
+        
+        mock_client.http_client.request.assert_not_called()
+    
+    def test_download_without_http_client(self, mock_client, fake_fs):
+        """HTTP client'ı olmayan main client ile download hata vermeli."""
+        mock_client.get.return_value = _att_resp()
+        client = AttachmentClient(mock_client)
+        client.http_client = None
+        
+        fake_fs(exists=False)
+        with pytest.raises(EspoCRMError, match="HTTP client"):
+            client.download_file("attachment_123")
+    
+    @pytest.mark.parametrize("status_code,content_range", [
+        (200, "bytes 0-999/1000"),  # Content-Range ama 206 değil
+        (206, "bytes 0-999/2000"),  # Toplam boyut uyuşmuyor
+        (206, "bytes */1000"),  # Geçersiz format
+    ])
+    def test_invalid_content_range(self, mock_client, att_client, fake_fs, fake_download_response, status_code, content_range):
+        """Geçersiz Content-Range header testi."""
+        mock_client.get.side_effect = itertools.cycle([_CORRUPT_META])
+        download_response = fake_download_response(
+            [_CORRUPT_CHUNK], status_code=status_code, headers={"Content-Range": content_range}
+        )
+        mock_client.http_client.request.return_value = download_response
+        
+        fake_fs(exists=False)
+        with pytest.raises(AttachmentError):
+            att_client.download_file("attachment_123")
         
-        # Should detect size mismatch or handle gracefully
-        with patch("pathlib.Path.exists", return_value=False):
-            with patch("pathlib.Path.mkdir"):
-                with patch("builtins.open", mock_open()) as mock_file:
-                    try:
-                        result = att_client.download_file("attachment_123", validate_checksum=True)
-                        # If download succeeds despite size mismatch, that's also acceptable
-                    except Exception as e:
-                        # Expected: EspoCRMError due to size mismatch or FileExistsError
-                        exception_names = ["AttachmentError", "FileExistsError", "EspoCRMError"]
-                        assert any(exc_name in str(type(e)) for exc_name in exception_names)
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+        assert mock_client.get.call_count == 1
+        assert download_response.iter_content_calls == 0
@@ -11,6 +11,7 @@ from datetime import datetime
 import responses
 
 from espocrm.clients.metadata import MetadataClient, MetadataCache
+from espocrm.utils import http as http_module
 from espocrm.models.metadata import (
     FieldType,
     RelationshipType,
@@ -21,8 +22,12 @@ from espocrm.models.metadata import (
     MetadataRequest
 )
 from espocrm.exceptions import (
+    EspoCRMAuthenticationError,
+    EspoCRMAuthorizationError,
+    EspoCRMConnectionError,
     EspoCRMError,
     EspoCRMNotFoundError,
+    EspoCRMServerError,
     EspoCRMValidationError,
     MetadataError
 )
@@ -135,6 +140,113 @@ class TestMetadataClient:
         assert "lastName" in required_fields
         assert "firstName" not in required_fields
     
+    def test_get_entities_metadata_single_request(self, mock_client):
+        """Birden fazla entity metadata'sının tek istekle alınması testi."""
+        # Mock response setup
+        mock_response = {
+            "entityDefs": {
+                "Account": {"fields": {"name": {"type": "varchar"}}},
+                "Contact": {"fields": {"lastName": {"type": "varchar"}}}
+            }
+        }
+        mock_client.get.return_value = mock_response
+        
+        meta_client = MetadataClient(mock_client)
+        
+        result = meta_client.get_entities_metadata(["Account", "Contact", "NonExistent"])
+        
+        # Assertions
+        assert result["Account"].has_field("name")
+        assert result["Contact"].has_field("lastName")
+        assert result["NonExistent"] is None
+        
+        # API call verification
+        mock_client.get.assert_called_once()
+    
+    def test_warm_cache_single_fetch(self, mock_client):
+        """warm_cache'in N entity için tek metadata isteği yapması testi."""
+        mock_client.get.return_value = {
+            "entityDefs": {
+                "Account": {
+                    "fields": {"name": {"type": "varchar"}},
+                    "links": {"contacts": {"type": "hasMany", "entity": "Contact"}}
+                },
+                "Contact": {"fields": {"emailAddress": {"type": "email"}}},
+                "Lead": {"fields": {"name": {"type": "varchar"}}}
+            }
+        }
+        
+        meta_client = MetadataClient(mock_client)
+        # Eski capabilities değeri warm_cache ile yeniden hesaplanmalı
+        meta_client.cache.set("api_capabilities", {"entities": []})
+        
+        meta_client.warm_cache(["Account", "Contact", "Lead"])
+        
+        mock_client.get.assert_called_once()
+        capabilities = meta_client.cache.get("api_capabilities")
+        assert sorted(capabilities["entities"]) == ["Account", "Contact", "Lead"]
+        assert sorted(capabilities["supported_field_types"]) == ["email", "varchar"]
+        assert capabilities["supported_relationship_types"] == ["hasMany"]
+    
+    @pytest.mark.parametrize("error", [
+        ConnectionError("Network error"),
+        TimeoutError("Request timeout"),
+        http_module.ConnectionError("Connection failed"),  # HTTPClient retry sonrası
+        http_module.TimeoutError("Request timeout"),
+        EspoCRMConnectionError("Connection refused"),
+        EspoCRMServerError("Service unavailable", status_code=503),
+    ])
+    def test_get_application_metadata_serves_stale_on_error(self, mock_client, error):
+        """Geçici fetch hatasında süresi dolmuş metadata'nın döndürülmesi testi."""
+        mock_client.get.return_value = {"entityDefs": {"Account": {"fields": {}}}}
+        
+        meta_client = MetadataClient(mock_client, cache_ttl=-1)  # Her entry expire
+        first = meta_client.get_application_metadata()
+        
+        # Refresh başarısız - stale kopya döner
+        mock_client.get.side_effect = error
+        assert meta_client.get_application_metadata() is first
+        assert mock_client.get.call_count == 2
+        
+        # force_refresh stale kopyaya düşmez
+        with pytest.raises(type(error)):
+            meta_client.get_application_metadata(force_refresh=True)
+    
+    def test_stale_metadata_on_transport_connection_error(self, mock_client, real_client, monkeypatch):
+        """Gerçek HTTPClient bağlantı hatasında stale metadata döndürülmesi testi."""
+        import requests
+        from responses import RequestsMock
+        
+        monkeypatch.setattr(http_module.time, "sleep", lambda seconds: None)  # Retry backoff'u atla
+        http_client = real_client.http_client
+        url = f"{http_client.base_url}/Metadata"
+        # İstekler production'daki HTTPClient retry/exception yolundan geçer
+        mock_client.get.side_effect = http_client.get
+        meta_client = MetadataClient(mock_client, cache_ttl=-1)
+        
+        with RequestsMock() as rsps:
+            rsps.get(url, json={"entityDefs": {"Account": {"fields": {}}}})
+            first = meta_client.get_application_metadata()
+            
+            rsps.replace("GET", url, body=requests.exceptions.ConnectionError("Connection refused"))
+            assert meta_client.get_application_metadata() is first
+    
+    @pytest.mark.parametrize("error", [
+        EspoCRMAuthenticationError("Unauthorized"),
+        EspoCRMAuthorizationError("Forbidden"),
+        EspoCRMError("Bad request", status_code=400),
+    ])
+    def test_get_application_metadata_propagates_client_errors(self, mock_client, error):
+        """Auth ve 4xx hatalarında stale kopya döndürülmemesi testi."""
+        mock_client.get.return_value = {"entityDefs": {"Account": {"fields": {}}}}
+        
+        meta_client = MetadataClient(mock_client, cache_ttl=-1)
+        meta_client.get_application_metadata()
+        
+        mock_client.get.side_effect = error
+        with pytest.raises(type(error)):
+            meta_client.get_application_metadata()
+    
     def test_get_field_metadata_success(self, mock_client):
         """Field metadata alma başarı testi."""
         # Mock response setup
@@ -472,6 +584,18 @@ class TestMetadataCache:
         # Assertions
         assert result is None
     
+    def test_cache_get_stale(self):
+        """Süresi dolmuş entry'nin stale okunması testi."""
+        cache = MetadataCache(ttl_seconds=-1)  # Set anında expire
+        
+        test_data = {"test": "data"}
+        cache.set("test_key", test_data)
+        
+        # Assertions
+        assert cache.get("test_key") is None
+        assert cache.get_stale("test_key") == test_data
+        assert cache.get_stale("missing_key") is None
+    
     def test_cache_clear(self):
         """Cache clear testi."""
         cache = MetadataCache()
@@ -128,7 +128,7 @@ class TestRunner:
         
         # Parallel execution
         if parallel:
-            args.extend(["-n", "auto"])
+            args.extend(["-n", "auto", "--dist", "worksteal"])
         
         # Additional options
         args.extend([